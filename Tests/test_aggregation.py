@@ -0,0 +1,188 @@
+"""
+Tests for aggregation and permission-aware queries (src/spiritual_os/aggregation.py).
+"""
+
+import copy
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.spiritual_os import aggregation
+from src.spiritual_os.aggregation import AggregationEngine, QueryBuilder
+from src.spiritual_os.models import Diocese, Parish, PermissionContext, User, UserRole
+
+
+def make_user(user_id, parish_id, diocese_id, opt_in=True, minutes=(), sacraments=()):
+    return User(
+        id=user_id, name=user_id, email=f"{user_id}@example.org", role=UserRole.INDIVIDUAL,
+        parish_id=parish_id, diocese_id=diocese_id,
+        opt_in_to_parish_aggregates=opt_in,
+        rule_of_life={"entries": [{"duration_minutes": m} for m in minutes]} if minutes else {},
+        sacrament_milestones=[{"name": s} for s in sacraments],
+    )
+
+
+@pytest.fixture
+def network():
+    """Two dioceses, three parishes, a handful of users"""
+    users = [
+        make_user("u1", "p1", "d1", minutes=(10, 20), sacraments=("Baptism",)),
+        make_user("u2", "p1", "d1", sacraments=("Baptism", "Confirmation")),
+        make_user("u3", "p1", "d1", opt_in=False, minutes=(99,)),
+        make_user("u4", "p2", "d1", minutes=(30,)),
+        make_user("u5", "p3", "d2"),
+    ]
+    parishes = [
+        Parish(id="p1", name="St A", diocese_id="d1", coordinator_id="u1"),
+        Parish(id="p2", name="St B", diocese_id="d1", coordinator_id="u4"),
+        Parish(id="p3", name="St C", diocese_id="d2", coordinator_id="u5"),
+    ]
+    dioceses = [
+        Diocese(id="d1", name="One", bishop_name="Bishop One", region="East"),
+        Diocese(id="d2", name="Two", bishop_name="Bishop Two", region="West"),
+        Diocese(id="d3", name="Three", bishop_name="Bishop Three", region="North"),
+    ]
+    return users, parishes, dioceses
+
+
+def context(user, role):
+    return PermissionContext(user_id=user.id, role=role, parish_id=user.parish_id, diocese_id=user.diocese_id)
+
+
+class TestAggregateAll:
+    """Bulk aggregation agrees with the one-entity-at-a-time functions"""
+    
+    def test_aggregate_all_parishes_matches_per_parish(self, network):
+        users, parishes, _ = network
+        expected = [
+            AggregationEngine.aggregate_parish_from_users(users, copy.deepcopy(p))
+            for p in parishes
+        ]
+        
+        result = AggregationEngine.aggregate_all_parishes(users, copy.deepcopy(parishes))
+        
+        assert result == expected
+        assert result[0].aggregated_members_count == 2
+        assert result[0].aggregated_formation_participants == 1
+        assert result[0].aggregated_avg_practice_minutes == 15
+        assert result[0].aggregated_sacrament_stats == {"Baptism": 2, "Confirmation": 1}
+    
+    def test_aggregate_all_parishes_in_worker_processes(self, network, monkeypatch):
+        users, parishes, _ = network
+        serial = AggregationEngine.aggregate_all_parishes(users, copy.deepcopy(parishes))
+        
+        monkeypatch.setattr(aggregation, "PARALLEL_MIN_USERS", 1)
+        parallel = AggregationEngine.aggregate_all_parishes(users, copy.deepcopy(parishes), max_workers=2)
+        
+        assert parallel == serial
+    
+    def test_aggregate_all_dioceses_matches_per_diocese(self, network):
+        users, parishes, dioceses = network
+        parishes = AggregationEngine.aggregate_all_parishes(users, parishes)
+        expected = [
+            AggregationEngine.aggregate_diocese_from_parishes(parishes, copy.deepcopy(d))
+            for d in dioceses
+        ]
+        
+        result = AggregationEngine.aggregate_all_dioceses(parishes, copy.deepcopy(dioceses))
+        
+        assert result == expected
+        assert [d.aggregated_parishes_count for d in result] == [2, 1, 0]
+        assert result[0].aggregated_formation_participants == 2
+
+
+class TestMaterializedAggregates:
+    """refresh_materialized / get_diocese_aggregate round trip"""
+    
+    def test_missing_store_returns_none(self, tmp_path):
+        assert AggregationEngine.get_diocese_aggregate("d1", tmp_path / "aggregates.db") is None
+    
+    def test_store_without_table_returns_none(self, tmp_path):
+        store = tmp_path / "aggregates.db"
+        sqlite3.connect(store).close()
+        
+        assert AggregationEngine.get_diocese_aggregate("d1", store) is None
+    
+    def test_refresh_only_rewrites_moved_versions(self, network, tmp_path):
+        _, parishes, dioceses = network
+        store = tmp_path / "aggregates.db"
+        
+        assert AggregationEngine.refresh_materialized(dioceses, parishes, {"d1": 1, "d2": 1}, store) == 3
+        assert AggregationEngine.refresh_materialized(dioceses, parishes, {"d1": 1, "d2": 1}, store) == 0
+        assert AggregationEngine.refresh_materialized(dioceses, parishes, {"d1": 2, "d2": 1}, store) == 1
+        assert AggregationEngine.get_diocese_aggregate("d1", store)["parishes_count"] == 2
+    
+    def test_sees_refresh_made_elsewhere(self, network, tmp_path):
+        _, parishes, dioceses = network
+        store = tmp_path / "aggregates.db"
+        AggregationEngine.refresh_materialized(dioceses, parishes, {"d1": 1}, store)
+        assert AggregationEngine.get_diocese_aggregate("d1", store)["parishes_count"] == 2
+        
+        # Another worker rewrites the row without going through this process
+        with sqlite3.connect(store) as conn:
+            conn.execute(
+                "UPDATE diocese_aggregates SET version = 2, aggregates = ? WHERE diocese_id = 'd1'",
+                ('{"parishes_count": 5}',)
+            )
+        
+        assert AggregationEngine.get_diocese_aggregate("d1", store) == {"parishes_count": 5}
+
+
+class TestVisibility:
+    """Indexed, streaming and list visibility queries agree for every role"""
+    
+    def test_build_indexes_buckets(self, network):
+        users, parishes, _ = network
+        
+        indexes = QueryBuilder.build_indexes(users, parishes)
+        
+        assert set(indexes) == {
+            "users_by_id", "users_by_parish", "users_by_diocese",
+            "parishes_by_id", "parishes_by_diocese",
+        }
+        assert [u.id for u in indexes["users_by_parish"]["p1"]] == ["u1", "u2", "u3"]
+        assert [u.id for u in indexes["users_by_diocese"]["d2"]] == ["u5"]
+        assert [p.id for p in indexes["parishes_by_diocese"]["d1"]] == ["p1", "p2"]
+        assert indexes["parishes_by_id"]["p3"] == [parishes[2]]
+    
+    @pytest.mark.parametrize("role", list(UserRole))
+    def test_visible_users_agree(self, network, role):
+        users, parishes, _ = network
+        requester = users[0]
+        ctx = context(requester, role)
+        indexes = QueryBuilder.build_indexes(users, parishes)
+        
+        streamed = list(QueryBuilder.iter_visible_users(iter(users), requester, ctx))
+        
+        assert QueryBuilder.get_visible_users(users, requester, ctx) == streamed
+        assert QueryBuilder.get_visible_users(users, requester, ctx, indexes) == streamed
+    
+    @pytest.mark.parametrize("role", list(UserRole))
+    def test_visible_parishes_agree(self, network, role):
+        users, parishes, _ = network
+        requester = users[0]
+        ctx = context(requester, role)
+        indexes = QueryBuilder.build_indexes(users, parishes)
+        
+        streamed = list(QueryBuilder.iter_visible_parishes(iter(parishes), requester, ctx))
+        
+        assert QueryBuilder.get_visible_parishes(parishes, requester, ctx) == streamed
+        assert QueryBuilder.get_visible_parishes(parishes, requester, ctx, indexes) == streamed
+    
+    def test_visible_users_by_role(self, network):
+        users, _, _ = network
+        requester = users[0]
+        
+        def visible(role):
+            return [u.id for u in QueryBuilder.iter_visible_users(users, requester, context(requester, role))]
+        
+        assert visible(UserRole.INDIVIDUAL) == ["u1"]
+        assert visible(UserRole.PARISH_COORDINATOR) == ["u1", "u2", "u3"]
+        assert visible(UserRole.DIOCESAN_LEADER) == ["u1", "u2", "u3", "u4"]
+        assert visible(UserRole.GLOBAL_COORDINATOR) == []
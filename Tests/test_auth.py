@@ -0,0 +1,231 @@
+"""
+Tests for authentication storage and permission checks (src/spiritual_os/auth.py).
+"""
+
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+pytest.importorskip("streamlit")
+
+from src.spiritual_os.auth import Authentication, PermissionManager
+
+
+@pytest.fixture
+def auth_paths(tmp_path, monkeypatch):
+    """Point the auth store at a temp dir and use a cheap scrypt cost"""
+    monkeypatch.setattr(Authentication, "AUTH_DB", tmp_path / "auth.db")
+    monkeypatch.setattr(Authentication, "LEGACY_AUTH_FILE", tmp_path / "auth.json")
+    monkeypatch.setattr(Authentication, "SCRYPT_N", 2 ** 4)
+    return tmp_path
+
+
+def write_legacy_store(path, **users):
+    """auth.json as written before the SQLite store, with SHA-256 hashes"""
+    path.write_text(json.dumps({
+        user_id: {
+            "name": user_id,
+            "email": email,
+            "role": "individual",
+            "parish_id": "parish_001",
+            "diocese_id": "diocese_001",
+            "password_hash": Authentication._legacy_hash_password(password),
+        }
+        for user_id, (email, password) in users.items()
+    }))
+
+
+def stored_hash(email):
+    with sqlite3.connect(Authentication.AUTH_DB) as conn:
+        (password_hash,) = conn.execute(
+            "SELECT password_hash FROM users WHERE email = ?", (email,)
+        ).fetchone()
+    return password_hash
+
+
+class TestLegacyMigration:
+    """Accounts from auth.json keep working after the move to auth.db"""
+    
+    def test_init_imports_legacy_accounts(self, auth_paths):
+        write_legacy_store(Authentication.LEGACY_AUTH_FILE, user_042=("old@example.com", "secret"))
+        
+        Authentication.init_auth_system()
+        
+        assert not Authentication.LEGACY_AUTH_FILE.exists()
+        assert (auth_paths / "auth.json.migrated").exists()
+        assert not stored_hash("old@example.com").startswith("scrypt$")
+        assert Authentication.login("old@example.com", "secret")[0] == "user_042"
+    
+    def test_login_imports_legacy_accounts_without_explicit_init(self, auth_paths):
+        write_legacy_store(Authentication.LEGACY_AUTH_FILE, user_042=("old@example.com", "secret"))
+        
+        assert Authentication.login("old@example.com", "secret")[0] == "user_042"
+        assert Authentication.login("old@example.com", "wrong") is None
+    
+    def test_legacy_file_left_after_db_exists_is_still_imported(self, auth_paths):
+        Authentication.init_auth_system()
+        write_legacy_store(Authentication.LEGACY_AUTH_FILE, user_042=("old@example.com", "secret"))
+        
+        assert Authentication.login("old@example.com", "secret")[0] == "user_042"
+        assert not Authentication.LEGACY_AUTH_FILE.exists()
+    
+    def test_existing_accounts_win_over_legacy_rows(self, auth_paths):
+        Authentication.init_auth_system()
+        write_legacy_store(Authentication.LEGACY_AUTH_FILE, user_001=("john@example.com", "changed"))
+        
+        Authentication.init_auth_system()
+        
+        assert Authentication.login("john@example.com", "demo")[0] == "user_001"
+        assert Authentication.login("john@example.com", "changed") is None
+
+
+class TestLogin:
+    """Password verification, hash upgrades and timing behaviour of login"""
+    
+    def test_legacy_hash_upgraded_to_scrypt_on_login(self, auth_paths):
+        write_legacy_store(Authentication.LEGACY_AUTH_FILE, user_042=("old@example.com", "secret"))
+        Authentication.init_auth_system()
+        
+        user_id, user_data = Authentication.login("old@example.com", "secret")
+        
+        assert user_id == "user_042"
+        assert stored_hash("old@example.com").startswith("scrypt$")
+        assert user_data["password_hash"] == stored_hash("old@example.com")
+        assert Authentication.login("old@example.com", "secret")[0] == "user_042"
+    
+    def test_failed_legacy_login_keeps_legacy_hash(self, auth_paths):
+        write_legacy_store(Authentication.LEGACY_AUTH_FILE, user_042=("old@example.com", "secret"))
+        Authentication.init_auth_system()
+        
+        assert Authentication.login("old@example.com", "wrong") is None
+        assert stored_hash("old@example.com") == Authentication._legacy_hash_password("secret")
+    
+    def test_unknown_email_still_runs_scrypt(self, auth_paths, monkeypatch):
+        Authentication.init_auth_system()
+        checked = []
+        verify = Authentication._verify_password
+        
+        def recording_verify(password, hash_):
+            checked.append(hash_)
+            return verify(password, hash_)
+        
+        monkeypatch.setattr(Authentication, "_verify_password", staticmethod(recording_verify))
+        
+        assert Authentication.login("nobody@example.com", "demo") is None
+        assert checked == [Authentication._dummy_hash()]
+        assert checked[0].startswith("scrypt$")
+    
+    def test_dummy_hash_never_matches(self, auth_paths):
+        for password in ("", "demo", "\0" * 16):
+            assert not Authentication._verify_password(password, Authentication._dummy_hash())
+
+
+class TestCreateUser:
+    """Account creation and its error messages"""
+    
+    def test_creates_user_that_can_log_in(self, auth_paths):
+        success, message = Authentication.create_user("Ann", "ann@example.com", "pw", "individual")
+        
+        assert success, message
+        assert Authentication.login("ann@example.com", "pw")[1]["name"] == "Ann"
+    
+    def test_duplicate_email_rejected(self, auth_paths):
+        Authentication.create_user("Ann", "ann@example.com", "pw", "individual")
+        
+        assert Authentication.create_user("Ann 2", "ann@example.com", "pw", "individual") == (
+            False, "Email already registered"
+        )
+    
+    def test_ids_do_not_collide_after_delete(self, auth_paths):
+        Authentication.create_user("Ann", "ann@example.com", "pw", "individual")
+        Authentication.create_user("Bob", "bob@example.com", "pw", "individual")
+        with sqlite3.connect(Authentication.AUTH_DB) as conn:
+            conn.execute("DELETE FROM users WHERE email = 'ann@example.com'")
+        
+        success, message = Authentication.create_user("Cy", "cy@example.com", "pw", "individual")
+        
+        assert success, message
+    
+    def test_other_constraint_failures_not_reported_as_duplicate_email(self, auth_paths):
+        success, message = Authentication.create_user(None, "x@example.com", "pw", "individual")
+        
+        assert not success
+        assert message != "Email already registered"
+
+
+PARISHES = [
+    {"id": "parish_001", "diocese_id": "diocese_001"},
+    {"id": "parish_002", "diocese_id": "diocese_001"},
+    {"id": "parish_003", "diocese_id": "diocese_002"},
+    {"id": "parish_004", "diocese_id": None},
+]
+DIOCESES = [{"id": "diocese_001"}, {"id": "diocese_002"}]
+ROLES = ["individual", "parish_coordinator", "diocesan_leader",
+         "global_coordinator", "crisis_responder", "unknown"]
+
+
+class TestParishPermissions:
+    """Single-parish checks and the list/index helpers agree"""
+    
+    @pytest.mark.parametrize("role", ROLES)
+    @pytest.mark.parametrize("user_diocese_id", ["diocese_001", None])
+    def test_filter_editable_matches_can_edit(self, role, user_diocese_id):
+        expected = [
+            p for p in PARISHES
+            if PermissionManager.can_edit_parish_data(
+                role, p["id"], "parish_001",
+                parish_diocese_id=p["diocese_id"], user_diocese_id=user_diocese_id
+            )
+        ]
+        
+        assert PermissionManager.filter_editable_parishes(
+            role, "parish_001", user_diocese_id, PARISHES
+        ) == expected
+    
+    def test_diocesan_leader_edits_own_diocese_only(self):
+        def can_edit(parish_diocese_id):
+            return PermissionManager.can_edit_parish_data(
+                "diocesan_leader", "parish_003", None,
+                parish_diocese_id=parish_diocese_id, user_diocese_id="diocese_001"
+            )
+        
+        assert can_edit("diocese_001")
+        assert not can_edit("diocese_002")
+        assert not can_edit(None)
+    
+    def test_can_edit_requires_diocese_ids(self):
+        with pytest.raises(TypeError):
+            PermissionManager.can_edit_parish_data("diocesan_leader", "parish_001", None)
+    
+    @pytest.mark.parametrize("role", ROLES)
+    def test_accessible_parishes_index_and_stream_agree(self, role):
+        index = PermissionManager.build_parish_index(PARISHES)
+        expected = PermissionManager.get_accessible_parishes(role, "parish_001", "diocese_001", PARISHES)
+        
+        assert PermissionManager.get_accessible_parishes(
+            role, "parish_001", "diocese_001", PARISHES, index=index
+        ) == expected
+        assert list(PermissionManager.get_accessible_parishes(
+            role, "parish_001", "diocese_001", PARISHES, as_iter=True
+        )) == expected
+    
+    def test_build_parish_index(self):
+        index = PermissionManager.build_parish_index(PARISHES)
+        
+        assert index["by_id"]["parish_002"] == [PARISHES[1]]
+        assert index["by_diocese"]["diocese_001"] == PARISHES[:2]
+    
+    @pytest.mark.parametrize("role", ROLES)
+    def test_accessible_dioceses_stream_agrees(self, role):
+        expected = PermissionManager.get_accessible_dioceses(role, "diocese_001", DIOCESES)
+        
+        assert list(PermissionManager.get_accessible_dioceses(
+            role, "diocese_001", DIOCESES, as_iter=True
+        )) == expected
@@ -0,0 +1,224 @@
+"""
+Tests for the SQLite persistence layer (src/spiritual_os/database.py).
+"""
+
+import gc
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.spiritual_os.database import Database
+from src.spiritual_os.models import Parish, User, UserRole
+
+
+@pytest.fixture
+def db(tmp_path):
+    return Database(str(tmp_path / "spiritual_os.db"))
+
+
+def make_user(user_id, **kwargs):
+    kwargs.setdefault("parish_id", "parish_001")
+    return User(id=user_id, name=user_id, email=f"{user_id}@example.org", role=UserRole.INDIVIDUAL, **kwargs)
+
+
+class TestTransaction:
+    """Database.transaction() groups writes and rolls them back together"""
+    
+    def test_commits_grouped_writes(self, db):
+        with db.transaction():
+            assert db.save_user(make_user("a"))
+            assert db.save_user(make_user("b"))
+        assert db.get_user("a") and db.get_user("b")
+    
+    def test_failed_save_rolls_back_earlier_writes(self, db):
+        broken = make_user("b")
+        broken.name = None  # violates users.name NOT NULL
+        
+        with pytest.raises(Exception):
+            with db.transaction():
+                db.save_user(make_user("a"))
+                db.save_user(broken)
+        
+        assert db.get_user("a") is None
+        assert not db._conn().in_transaction
+    
+    def test_failed_child_sync_rolls_back_parent_row(self, db):
+        user = make_user("a", journal_entries=["not a dict"])
+        
+        assert db.save_user(user) is False
+        assert db.get_user("a") is None
+        assert not db._conn().in_transaction
+    
+    def test_failed_bulk_save_inside_transaction_reraises(self, db):
+        broken = make_user("b")
+        broken.name = None
+        
+        with pytest.raises(Exception):
+            with db.transaction():
+                db.save_parish(Parish(id="p", name="P", diocese_id="d", coordinator_id="a"))
+                db.save_users_bulk([make_user("a"), broken])
+        
+        assert db.get_parish("p") is None
+        assert db.get_user("a") is None
+    
+    def test_save_outside_transaction_reports_failure(self, db):
+        broken = make_user("a")
+        broken.name = None
+        
+        assert db.save_user(broken) is False
+        assert db.save_users_bulk([broken]) == 0
+    
+    def test_failed_commit_rolls_back(self, db):
+        conn = db._conn()
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.execute("CREATE TABLE parent (id TEXT PRIMARY KEY)")
+        conn.execute("""
+            CREATE TABLE child (
+                parent_id TEXT REFERENCES parent(id) DEFERRABLE INITIALLY DEFERRED
+            )
+        """)
+        
+        # Deferred foreign keys are only checked at COMMIT
+        with pytest.raises(Exception):
+            with db.transaction():
+                db.save_user(make_user("a"))
+                conn.execute("INSERT INTO child VALUES ('missing')")
+        
+        assert not conn.in_transaction
+        assert db.get_user("a") is None
+        assert db.save_user(make_user("b"))
+        assert Database(db.db_path).get_user("b")
+
+
+class TestConnections:
+    """Per-thread connections are reused and closed when no longer reachable"""
+    
+    def test_connection_reused_within_thread(self, db):
+        assert db._conn() is db._conn()
+    
+    def test_connection_closed_when_thread_ends(self, db):
+        opened = []
+        
+        def worker():
+            db.get_user("a")
+            opened.append(db._conn())
+        
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        gc.collect()
+        
+        with pytest.raises(sqlite3.ProgrammingError):
+            opened[0].execute("SELECT 1")
+    
+    def test_connection_closed_when_database_dropped(self, tmp_path):
+        db = Database(str(tmp_path / "spiritual_os.db"))
+        conn = db._conn()
+        del db
+        gc.collect()
+        
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+
+class TestBulkSaves:
+    """save_*_bulk report the rows they wrote"""
+    
+    def test_counts_rows_from_generator(self, db):
+        assert db.save_users_bulk(make_user(f"u{i}") for i in range(5)) == 5
+        assert len(db.get_users_in_parish("parish_001")) == 5
+    
+    def test_replacing_rows_counts_each_once(self, db):
+        db.save_users_bulk([make_user("a"), make_user("b")])
+        
+        assert db.save_users_bulk([make_user("a"), make_user("b")]) == 2
+    
+    def test_parish_bulk_count(self, db):
+        parishes = (Parish(id=f"p{i}", name="P", diocese_id="d", coordinator_id="a") for i in range(3))
+        
+        assert db.save_parishes_bulk(parishes) == 3
+    
+    def test_empty_bulk_writes_nothing(self, db):
+        assert db.save_users_bulk([]) == 0
+
+
+def journal_entry(day, template_type):
+    return {"date": day, "template_type": template_type, "title": "", "content": ""}
+
+
+class TestChildTables:
+    """Journal entries and parish events are mirrored into indexed tables"""
+    
+    def test_journal_entries_mirrored_and_replaced(self, db):
+        user = make_user("a", journal_entries=[
+            journal_entry("2026-01-01", "examen"),
+            journal_entry("2026-01-01", "examen"),
+            journal_entry("2026-01-02", "lectio_divina"),
+        ])
+        db.save_user(user)
+        db.save_user(make_user("b", journal_entries=[journal_entry("2026-01-03", "examen")]))
+        db.save_user(make_user("c", parish_id="other", journal_entries=[journal_entry("2026-01-03", "examen")]))
+        
+        assert db.count_journal_entries_by_template("parish_001") == {"examen": 3, "lectio_divina": 1}
+        
+        user.journal_entries = user.journal_entries[:1]
+        db.save_user(user)
+        
+        assert db.count_journal_entries_by_template("parish_001") == {"examen": 2}
+    
+    def test_bulk_save_mirrors_journal_entries(self, db):
+        db.save_users_bulk([
+            make_user("a", journal_entries=[journal_entry("2026-01-01", "examen")]),
+            make_user("b", journal_entries=[journal_entry("2026-01-01", "fatigue_warning")]),
+        ])
+        
+        assert db.count_journal_entries_by_template("parish_001") == {"examen": 1, "fatigue_warning": 1}
+    
+    def test_parish_events_mirrored_and_replaced(self, db):
+        parish = Parish(id="p", name="P", diocese_id="d", coordinator_id="a", events=[
+            {"name": "Retreat", "date": "2026-01-10", "ministry": "formation"},
+            {"name": "Feast", "date": "2026-03-01", "ministry": "community"},
+        ])
+        db.save_parish(parish)
+        
+        assert db.count_parish_events("p") == 2
+        assert db.count_parish_events("p", since="2026-02-01") == 1
+        
+        parish.events = []
+        db.save_parishes_bulk([parish])
+        
+        assert db.count_parish_events("p") == 0
+    
+    def test_backfill_from_json_columns(self, db):
+        db.save_user(make_user("a", journal_entries=[
+            journal_entry("2026-01-01", "examen"),
+            journal_entry("2026-01-02", "examen"),
+        ]))
+        db.save_parish(Parish(id="p", name="P", diocese_id="d", coordinator_id="a", events=[
+            {"name": "Retreat", "date": "2026-01-10"},
+        ]))
+        
+        # A database from before the child tables existed
+        conn = db._conn()
+        conn.execute("DROP TABLE user_journal_entries")
+        conn.execute("DROP TABLE parish_events")
+        
+        reopened = Database(db.db_path)
+        
+        assert reopened.count_journal_entries_by_template("parish_001") == {"examen": 2}
+        assert reopened.count_parish_events("p") == 1
+    
+    def test_backfill_runs_only_once(self, db):
+        db.save_user(make_user("a", journal_entries=[journal_entry("2026-01-01", "examen")]))
+        
+        Database(db.db_path)
+        Database(db.db_path)
+        
+        assert db.count_journal_entries_by_template("parish_001") == {"examen": 1}
@@ -0,0 +1,32 @@
+"""
+Tests for privacy-first local file storage (src/spiritual_os/storage/local_store.py).
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.spiritual_os.storage.local_store import LocalStore
+
+
+class TestSaveUserData:
+    """save_user_data replaces files atomically"""
+    
+    def test_round_trip(self, tmp_path):
+        store = LocalStore(str(tmp_path))
+        
+        assert store.save_user_data("u1", "rule", {"prayer": 10})
+        assert store.load_user_data("u1", "rule")["prayer"] == 10
+    
+    def test_failed_write_keeps_old_file_and_removes_temp(self, tmp_path):
+        store = LocalStore(str(tmp_path))
+        store.save_user_data("u1", "rule", {"prayer": 10})
+        
+        # json.dump fails part-way through the temp file
+        assert not store.save_user_data("u1", "rule", {"prayer": 20, "bad": object()})
+        
+        assert store.load_user_data("u1", "rule")["prayer"] == 10
+        assert list(store.user_dir.glob("*.tmp")) == []
@@ -10,7 +10,9 @@ import sys
 from pathlib import Path
 
 # Add src to path
-sys.path.insert(0, str(Path(__file__).parent))
+ROOT = str(Path(__file__).resolve().parent)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
 
 from src.spiritual_os.models import (
     User, Parish, Diocese, JusticeCampaign, CrisisEvent,
@@ -503,7 +505,7 @@ def show_lens_global():
     
     st.divider()
     
-    col1, col2, col3 = st.columns(3)
+    col1, col2, _ = st.columns(3)
     
     with col1:
         if st.button("← Back to Diocese"):
@@ -515,9 +517,6 @@ def show_lens_global():
             if st.button("🚨 Activate Crisis Mode"):
                 st.session_state.crisis_active = True
                 st.rerun()
-    
-    with col3:
-        st.write("")
 
 # ============================================================================
 # LENS: CRISIS (Emergency Response)
@@ -14,20 +14,19 @@ Follows Catholic subsidiarity principle:
 """
 
 import streamlit as st
+import pandas as pd
 import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add src to path
+ROOT = str(Path(__file__).resolve().parent.parent)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
 
 from src.spiritual_os.federated_identity import (
-    FederatedParishIdentity,
-    GeoLocation,
-    ContactInfo,
-    DioceseRegistration,
     WESTLANDS_EXPAT_PARISH,
     NAMUGONGO_RURAL_PARISH,
 )
-from src.spiritual_os.church_directory import ChurchDirectory, DEMO_CHURCHES
 
 st.set_page_config(
     page_title="Global Network | Catholic Spiritual OS",
@@ -35,6 +34,70 @@ st.set_page_config(
     layout="wide"
 )
 
+# Demo data (module level so reruns reuse the same objects)
+DEMO_PARISHES = {
+    "St. Austin's (Westlands, Nairobi)": WESTLANDS_EXPAT_PARISH,
+    "St. Charles Lwanga (Namugongo, Uganda)": NAMUGONGO_RURAL_PARISH,
+}
+
+DEMO_NEARBY_PARISHES = [
+    {
+        "name": "All Saints Cathedral",
+        "distance": 12.3,
+        "city": "Nairobi",
+        "phone": "+254-722-234567",
+        "whatsapp": True,
+        "mass_languages": ["English", "Swahili", "French"],
+    },
+    {
+        "name": "Holy Family Basilica",
+        "distance": 15.7,
+        "city": "Nairobi",
+        "phone": "+254-722-345678",
+        "whatsapp": True,
+        "mass_languages": ["English", "Swahili"],
+    },
+]
+
+DEMO_CAMPAIGNS = [
+    {
+        "name": "Living Wage - East Africa",
+        "parishes": 150,
+        "volunteers": 2400,
+        "workers_affected": 26000,
+        "impact": "26% average wage increase",
+        "coordinator": "Diocese of Nairobi Justice Office",
+        "contact": "+254-722-456789 (WhatsApp)",
+    },
+    {
+        "name": "Refugee Rights & Integration",
+        "parishes": 89,
+        "volunteers": 1200,
+        "workers_affected": 12000,
+        "impact": "Policy wins in 3 countries",
+        "coordinator": "Kenya Conference of Catholic Bishops",
+        "contact": "+254-722-567890 (WhatsApp)",
+    },
+]
+
+# Static quick stats, emitted as one element instead of 4 columns + 4 metrics
+GLOBAL_STATS = [
+    ("Global Parishes", "100,000+", "Goal for production"),
+    ("Countries", "200+", ""),
+    ("Languages", "50+", ""),
+    ("Catholics Served", "1.3B", ""),
+]
+
+GLOBAL_STATS_HTML = (
+    '<div class="metric-container" style="display:flex;justify-content:space-between;">'
+    + "".join(
+        f'<div title="{hint}"><div style="font-size:14px;">{label}</div>'
+        f'<div style="font-size:32px;">{value}</div></div>'
+        for label, value, hint in GLOBAL_STATS
+    )
+    + "</div>"
+)
+
 st.title("🌍 Global Catholic Network")
 st.caption("Federated parish coordination • No central authority • Subsidiarity principle")
 
@@ -73,11 +136,11 @@ with col2:
     # Demo parish selector
     demo_parish = st.selectbox(
         "View Demo Parish",
-        ["St. Austin's (Westlands, Nairobi)", "St. Charles Lwanga (Namugongo, Uganda)"],
+        list(DEMO_PARISHES),
         key="demo_parish_selector"
     )
     
-    parish = WESTLANDS_EXPAT_PARISH if "Westlands" in demo_parish else NAMUGONGO_RURAL_PARISH
+    parish = DEMO_PARISHES[demo_parish]
 
 # Display parish identity
 with st.expander("📋 Parish Identity Card", expanded=True):
@@ -127,37 +190,38 @@ if demo_parish:
     4. Peer broadcasts (nearby parishes announce themselves)
     """)
     
-    # Show demo nearby parishes
-    nearby = [
-        {
-            "name": "All Saints Cathedral",
-            "distance": 12.3,
-            "city": "Nairobi",
-            "phone": "+254-722-234567",
-            "whatsapp": True,
-            "mass_languages": ["English", "Swahili", "French"],
-        },
-        {
-            "name": "Holy Family Basilica",
-            "distance": 15.7,
-            "city": "Nairobi",
-            "phone": "+254-722-345678",
-            "whatsapp": True,
-            "mass_languages": ["English", "Swahili"],
-        },
-    ]
+    event = st.dataframe(
+        pd.DataFrame(DEMO_NEARBY_PARISHES).rename(columns={
+            "name": "Parish",
+            "distance": "Distance (km)",
+            "city": "City",
+            "phone": "Contact",
+            "whatsapp": "WhatsApp",
+            "mass_languages": "Mass Languages",
+        }),
+        use_container_width=True,
+        hide_index=True,
+        on_select="rerun",
+        selection_mode="single-row",
+        key="nearby_parishes",
+    )
     
-    for p in nearby:
-        with st.expander(f"⛪ {p['name']} — {p['distance']:.1f} km away"):
-            col1, col2 = st.columns(2)
-            with col1:
-                st.write(f"**Location**: {p['city']}")
-                st.write(f"**Contact**: {p['phone']}")
-                st.write(f"**WhatsApp**: {'✅' if p['whatsapp'] else '❌'}")
-            with col2:
-                st.write(f"**Mass Languages**: {', '.join(p['mass_languages'])}")
-                if st.button(f"Connect with {p['name']}", key=f"connect_{p['name']}"):
-                    st.success(f"✅ Connection request sent to {p['name']}")
+    # Details only for the selected row, not an expander per parish
+    if event.selection.rows:
+        p = DEMO_NEARBY_PARISHES[event.selection.rows[0]]
+        col1, col2 = st.columns(2)
+        with col1:
+            st.write(f"**Location**: {p['city']}")
+            st.write(f"**Contact**: {p['phone']}")
+            st.write(f"**WhatsApp**: {'✅' if p['whatsapp'] else '❌'}")
+        with col2:
+            st.write(f"**Mass Languages**: {', '.join(p['mass_languages'])}")
+    
+    with st.form("connect_form"):
+        to_connect = st.multiselect("Parishes to connect with", [p["name"] for p in DEMO_NEARBY_PARISHES])
+        
+        if st.form_submit_button("📧 Send Connection Requests") and to_connect:
+            st.success("✅ Connection requests sent to:\n" + "\n".join(f"- {name}" for name in to_connect))
 
 st.divider()
 
@@ -175,50 +239,39 @@ st.markdown("""
 - No central authority required
 """)
 
-tabs = st.tabs(["Active Campaigns", "Start New Campaign", "Impact Tracking"])
 
-with tabs[0]:
+def show_active_campaigns():
+    """Active justice campaigns"""
     st.subheader("🌍 Active Justice Campaigns")
     
-    campaigns = [
-        {
-            "name": "Living Wage - East Africa",
-            "parishes": 150,
-            "volunteers": 2400,
-            "workers_affected": 26000,
-            "impact": "26% average wage increase",
-            "coordinator": "Diocese of Nairobi Justice Office",
-            "contact": "+254-722-456789 (WhatsApp)",
-        },
-        {
-            "name": "Refugee Rights & Integration",
-            "parishes": 89,
-            "volunteers": 1200,
-            "workers_affected": 12000,
-            "impact": "Policy wins in 3 countries",
-            "coordinator": "Kenya Conference of Catholic Bishops",
-            "contact": "+254-722-567890 (WhatsApp)",
-        },
-    ]
+    st.dataframe(
+        pd.DataFrame(DEMO_CAMPAIGNS).rename(columns={
+            "name": "Campaign",
+            "parishes": "Parishes Involved",
+            "volunteers": "Volunteers",
+            "workers_affected": "Workers Affected",
+            "impact": "Impact",
+            "coordinator": "Coordinator",
+            "contact": "Contact",
+        }),
+        use_container_width=True,
+        hide_index=True,
+    )
     
-    for campaign in campaigns:
-        with st.expander(f"📢 {campaign['name']}", expanded=False):
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.metric("Parishes Involved", campaign['parishes'])
-                st.metric("Volunteers", campaign['volunteers'])
-                st.metric("Workers Affected", f"{campaign['workers_affected']:,}")
-            
-            with col2:
-                st.write(f"**Impact**: {campaign['impact']}")
-                st.write(f"**Coordinator**: {campaign['coordinator']}")
-                st.write(f"**Contact**: {campaign['contact']}")
-                
-                if st.button(f"Join Campaign", key=f"join_{campaign['name']}"):
-                    st.success(f"✅ Joined {campaign['name']}! Coordinator will contact you.")
-
-with tabs[1]:
+    # One form submit per batch of joins instead of one rerun per button
+    with st.form("join_campaigns"):
+        to_join = st.multiselect("Campaigns to join", [c["name"] for c in DEMO_CAMPAIGNS])
+        
+        if st.form_submit_button("Join Campaigns") and to_join:
+            st.success(
+                "✅ Joined! Coordinators will contact you.\n"
+                + "\n".join(f"- {name}" for name in to_join)
+            )
+
+
+@st.fragment
+def show_new_campaign():
+    """Start a new justice campaign"""
     st.subheader("🚀 Start New Campaign")
     
     st.markdown("""
@@ -257,7 +310,10 @@ with tabs[1]:
             **Coordinator**: {campaign_contact}
             """)
 
-with tabs[2]:
+
+@st.fragment
+def show_impact_tracking():
+    """Voluntary impact reporting"""
     st.subheader("📊 Impact Tracking")
     
     st.markdown("""
@@ -275,7 +331,7 @@ with tabs[2]:
         
         campaign_select = st.selectbox(
             "Campaign",
-            ["Living Wage - East Africa", "Refugee Rights & Integration"]
+            [c["name"] for c in DEMO_CAMPAIGNS]
         )
         
         col1, col2 = st.columns(2)
@@ -302,6 +358,24 @@ with tabs[2]:
             - Global Church celebrate wins
             """)
 
+
+# Only the selected section runs on each rerun (st.tabs executes every body);
+# the two form sections are fragments so a submit reruns just the form area
+CAMPAIGN_SECTIONS = {
+    "Active Campaigns": show_active_campaigns,
+    "Start New Campaign": show_new_campaign,
+    "Impact Tracking": show_impact_tracking,
+}
+
+campaign_section = st.radio(
+    "Campaign section",
+    list(CAMPAIGN_SECTIONS),
+    horizontal=True,
+    label_visibility="collapsed",
+    key="campaign_section",
+)
+CAMPAIGN_SECTIONS[campaign_section]()
+
 st.divider()
 
 # ============================================================================
@@ -387,16 +461,7 @@ with col2:
 
 # Quick stats
 st.divider()
-col1, col2, col3, col4 = st.columns(4)
-
-with col1:
-    st.metric("Global Parishes", "100,000+", help="Goal for production")
-with col2:
-    st.metric("Countries", "200+")
-with col3:
-    st.metric("Languages", "50+")
-with col4:
-    st.metric("Catholics Served", "1.3B")
+st.markdown(GLOBAL_STATS_HTML, unsafe_allow_html=True)
 
 # Footer
 st.divider()
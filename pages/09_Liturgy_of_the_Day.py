@@ -11,14 +11,17 @@ import streamlit as st
 import sys
 from pathlib import Path
 from datetime import date, timedelta
+from types import MappingProxyType
 
 # Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+ROOT = str(Path(__file__).resolve().parent.parent)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
 
 from src.spiritual_os.liturgical_calendar import (
     LiturgicalCalendar,
-    LiturgicalColor,
-    LiturgicalSeason
+    LiturgicalSeason,
+    COLOR_EMOJI,
 )
 from src.spiritual_os.mass_readings import MassReadingsAPI, ReadingType
 
@@ -29,6 +32,103 @@ st.set_page_config(
     layout="wide"
 )
 
+# Lookup tables (module level so reruns don't rebuild them)
+SEASON_EMOJI = MappingProxyType({
+    LiturgicalSeason.ORDINARY: "🌱",
+    LiturgicalSeason.ADVENT: "🕯️",
+    LiturgicalSeason.CHRISTMAS: "⭐",
+    LiturgicalSeason.LENT: "🙏",
+    LiturgicalSeason.EASTER: "🌅"
+})
+
+SEASON_PROMPTS = MappingProxyType({
+    LiturgicalSeason.ORDINARY: "How is God calling you to grow in everyday faithfulness today?",
+    LiturgicalSeason.ADVENT: "How are you preparing room in your heart for Christ's coming?",
+    LiturgicalSeason.CHRISTMAS: "Where do you see God's light breaking into darkness in your life?",
+    LiturgicalSeason.LENT: "What is God inviting you to let go of or take up in this season?",
+    LiturgicalSeason.EASTER: "How are you experiencing Christ's resurrection in your daily life?"
+})
+
+SEASON_GUIDES = MappingProxyType({
+    "🕯️ Advent (4 weeks before Christmas)": """
+    **Theme**: Waiting and preparation for Christ's coming
+    
+    **Color**: Purple (preparation, penance)
+    
+    **Focus**: Anticipation, hope, preparation of heart
+    
+    **Special Note**: 3rd Sunday (Gaudete Sunday) uses rose vestments to celebrate joy in anticipation
+    """,
+    "⭐ Christmas (Dec 25 - Baptism of the Lord)": """
+    **Theme**: Joy of the Incarnation
+    
+    **Color**: White (joy, purity, glory)
+    
+    **Focus**: God becoming human, Emmanuel (God with us)
+    
+    **Duration**: From Christmas Eve through Baptism of the Lord (early January)
+    """,
+    "🌱 Ordinary Time (2 periods)": """
+    **Theme**: Growth in discipleship
+    
+    **Color**: Green (growth, life, hope)
+    
+    **Focus**: Following Christ day by day, formation in virtue
+    
+    **Duration**:
+    - Period 1: After Christmas until Ash Wednesday
+    - Period 2: After Pentecost until Advent (longest period)
+    """,
+    "🙏 Lent (Ash Wednesday to Holy Thursday)": """
+    **Theme**: Repentance and preparation for Easter
+    
+    **Color**: Purple (penance, conversion)
+    
+    **Focus**: Prayer, fasting, almsgiving; dying to self
+    
+    **Special Note**: 4th Sunday (Laetare Sunday) uses rose vestments for rejoicing at coming Easter
+    
+    **Duration**: 40 days (not counting Sundays) + Holy Week
+    """,
+    "🌅 Easter (Easter Sunday through Pentecost)": """
+    **Theme**: Resurrection and new life in Christ
+    
+    **Color**: White (through Ascension), Red (Pentecost)
+    
+    **Focus**: Baptismal renewal, living as resurrection people
+    
+    **Duration**: 50 days from Easter Sunday to Pentecost
+    
+    **Culmination**: Pentecost (descent of Holy Spirit)
+    """,
+})
+
+
+@st.cache_data(ttl=24 * 3600, show_spinner=False)
+def _cached_liturgical_day(day_iso: str):
+    """One Church Calendar API call per day per process, not per rerun"""
+    day = LiturgicalCalendar.get_day(date.fromisoformat(day_iso))
+    if day is None:
+        # st.cache_data doesn't cache exceptions, so a failed lookup is
+        # retried on the next rerun instead of sticking for a day
+        raise LookupError(day_iso)
+    return day
+
+
+def _liturgical_day(day_iso: str):
+    """Liturgical day for a date, or None if it couldn't be retrieved"""
+    try:
+        return _cached_liturgical_day(day_iso)
+    except LookupError:
+        return None
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _mass_readings(day_iso: str):
+    """Readings for a date; hourly TTL so a failed fetch's fallback is retried"""
+    return MassReadingsAPI.get_readings(date.fromisoformat(day_iso))
+
+
 # Data mode indicator
 st.info("📊 **Data Mode**: LIVE — Connected to Church Calendar API", icon="ℹ️")
 
@@ -45,7 +145,8 @@ Each season invites us into different aspects of Christ's life and our formation
 
 st.header("Today's Celebration")
 
-today = LiturgicalCalendar.get_today()
+today_date = date.today()
+today = _liturgical_day(today_date.isoformat())
 
 if today:
     col1, col2, col3 = st.columns([2, 1, 1])
@@ -56,15 +157,7 @@ if today:
     
     with col2:
         # Liturgical color
-        color_emoji = {
-            LiturgicalColor.GREEN: "🟢",
-            LiturgicalColor.WHITE: "⚪",
-            LiturgicalColor.RED: "🔴",
-            LiturgicalColor.PURPLE: "🟣",
-            LiturgicalColor.ROSE: "🌸",
-            LiturgicalColor.BLACK: "⚫"
-        }
-        emoji = color_emoji.get(today.color, "🔵")
+        emoji = COLOR_EMOJI.get(today.color, "🔵")
         
         st.metric(
             label="Liturgical Color",
@@ -73,14 +166,7 @@ if today:
     
     with col3:
         # Liturgical season
-        season_emoji = {
-            LiturgicalSeason.ORDINARY: "🌱",
-            LiturgicalSeason.ADVENT: "🕯️",
-            LiturgicalSeason.CHRISTMAS: "⭐",
-            LiturgicalSeason.LENT: "🙏",
-            LiturgicalSeason.EASTER: "🌅"
-        }
-        s_emoji = season_emoji.get(today.season, "📅")
+        s_emoji = SEASON_EMOJI.get(today.season, "📅")
         
         st.metric(
             label="Season",
@@ -107,15 +193,7 @@ if today:
     # Spiritual reflection prompt
     st.markdown("### Reflection Prompt")
     
-    season_prompts = {
-        LiturgicalSeason.ORDINARY: "How is God calling you to grow in everyday faithfulness today?",
-        LiturgicalSeason.ADVENT: "How are you preparing room in your heart for Christ's coming?",
-        LiturgicalSeason.CHRISTMAS: "Where do you see God's light breaking into darkness in your life?",
-        LiturgicalSeason.LENT: "What is God inviting you to let go of or take up in this season?",
-        LiturgicalSeason.EASTER: "How are you experiencing Christ's resurrection in your daily life?"
-    }
-    
-    prompt = season_prompts.get(today.season, "How is God present in your life today?")
+    prompt = SEASON_PROMPTS.get(today.season, "How is God present in your life today?")
     st.write(f"💭 *{prompt}*")
     
 else:
@@ -133,7 +211,7 @@ st.markdown("""
 The Word of God proclaimed at Mass. Listen, reflect, and respond to God's call in Scripture.
 """)
 
-mass_readings = MassReadingsAPI.get_today()
+mass_readings = _mass_readings(today_date.isoformat())
 
 if mass_readings:
     # Display liturgical context
@@ -164,8 +242,7 @@ if mass_readings:
         if mass_readings.reflections:
             st.markdown("---")
             st.markdown("**Reflection Questions:**")
-            for reflection in mass_readings.reflections:
-                st.write(f"💭 {reflection}")
+            st.markdown("\n\n".join(f"💭 {r}" for r in mass_readings.reflections))
     
     # Alleluia
     if mass_readings.alleluia:
@@ -202,33 +279,39 @@ st.divider()
 
 st.header("Browse Liturgical Calendar")
 
-col_prev, col_date, col_next = st.columns([1, 2, 1])
-
-with col_date:
-    selected_date = st.date_input(
-        "Select date",
-        value=date.today(),
-        min_value=date(1970, 1, 1),
-        max_value=date(2099, 12, 31)
-    )
-
-if selected_date != date.today():
-    selected_day = LiturgicalCalendar.get_day(selected_date)
+# Picking a date reruns only the browser, not the readings above it
+@st.fragment
+def _calendar_browser():
+    col_prev, col_date, col_next = st.columns([1, 2, 1])
+    
+    with col_date:
+        selected_date = st.date_input(
+            "Select date",
+            value=today_date,
+            min_value=date(1970, 1, 1),
+            max_value=date(2099, 12, 31)
+        )
     
-    if selected_day:
-        st.subheader(selected_day.primary_celebration)
-        st.markdown(f"**{selected_day.date.strftime('%A, %B %d, %Y')}**")
+    if selected_date != today_date:
+        selected_day = _liturgical_day(selected_date.isoformat())
         
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.write(f"**Color**: {selected_day.color.value.capitalize()}")
-            st.write(f"**Season**: {selected_day.season.value.capitalize()}, Week {selected_day.season_week}")
-        
-        with col2:
-            st.write(f"**Rank**: {selected_day.rank}")
-    else:
-        st.warning(f"Unable to retrieve liturgical data for {selected_date}")
+        if selected_day:
+            st.subheader(selected_day.primary_celebration)
+            st.markdown(f"**{selected_day.date.strftime('%A, %B %d, %Y')}**")
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.write(f"**Color**: {selected_day.color.value.capitalize()}")
+                st.write(f"**Season**: {selected_day.season.value.capitalize()}, Week {selected_day.season_week}")
+            
+            with col2:
+                st.write(f"**Rank**: {selected_day.rank}")
+        else:
+            st.warning(f"Unable to retrieve liturgical data for {selected_date}")
+
+
+_calendar_browser()
 
 st.divider()
 
@@ -238,66 +321,14 @@ st.divider()
 
 st.header("Liturgical Seasons Guide")
 
-with st.expander("🕯️ Advent (4 weeks before Christmas)"):
-    st.markdown("""
-    **Theme**: Waiting and preparation for Christ's coming
-    
-    **Color**: Purple (preparation, penance)
-    
-    **Focus**: Anticipation, hope, preparation of heart
-    
-    **Special Note**: 3rd Sunday (Gaudete Sunday) uses rose vestments to celebrate joy in anticipation
-    """)
-
-with st.expander("⭐ Christmas (Dec 25 - Baptism of the Lord)"):
-    st.markdown("""
-    **Theme**: Joy of the Incarnation
-    
-    **Color**: White (joy, purity, glory)
-    
-    **Focus**: God becoming human, Emmanuel (God with us)
-    
-    **Duration**: From Christmas Eve through Baptism of the Lord (early January)
-    """)
-
-with st.expander("🌱 Ordinary Time (2 periods)"):
-    st.markdown("""
-    **Theme**: Growth in discipleship
-    
-    **Color**: Green (growth, life, hope)
-    
-    **Focus**: Following Christ day by day, formation in virtue
-    
-    **Duration**: 
-    - Period 1: After Christmas until Ash Wednesday
-    - Period 2: After Pentecost until Advent (longest period)
-    """)
-
-with st.expander("🙏 Lent (Ash Wednesday to Holy Thursday)"):
-    st.markdown("""
-    **Theme**: Repentance and preparation for Easter
-    
-    **Color**: Purple (penance, conversion)
-    
-    **Focus**: Prayer, fasting, almsgiving; dying to self
-    
-    **Special Note**: 4th Sunday (Laetare Sunday) uses rose vestments for rejoicing at coming Easter
-    
-    **Duration**: 40 days (not counting Sundays) + Holy Week
-    """)
-
-with st.expander("🌅 Easter (Easter Sunday through Pentecost)"):
-    st.markdown("""
-    **Theme**: Resurrection and new life in Christ
-    
-    **Color**: White (through Ascension), Red (Pentecost)
-    
-    **Focus**: Baptismal renewal, living as resurrection people
-    
-    **Duration**: 50 days from Easter Sunday to Pentecost
-    
-    **Culmination**: Pentecost (descent of Holy Spirit)
-    """)
+season_guide = st.radio(
+    "Season",
+    list(SEASON_GUIDES),
+    horizontal=True,
+    label_visibility="collapsed",
+    key="season_guide"
+)
+st.markdown(SEASON_GUIDES[season_guide])
 
 st.divider()
 
@@ -10,16 +10,15 @@ Kenya has 45,000+ SCCs as the primary way of "being Church" at grassroots.
 import streamlit as st
 import sys
 from pathlib import Path
-from datetime import datetime, timedelta
+from types import MappingProxyType
 
 # Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+ROOT = str(Path(__file__).resolve().parent.parent)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
 
 from src.spiritual_os.domain.scc import (
-    SmallChristianCommunity,
-    Zone,
     SCCMinistry,
-    MeetingFrequency,
     DEMO_SCC,
     DEMO_ZONE
 )
@@ -31,6 +30,82 @@ st.set_page_config(
     layout="wide"
 )
 
+MINISTRY_LABEL = MappingProxyType({
+    SCCMinistry.PRAYER: "🙏 Prayer & Worship",
+    SCCMinistry.SOCIAL_ACTION: "🤝 Social Action",
+    SCCMinistry.FORMATION: "📚 Faith Formation",
+    SCCMinistry.EVANGELIZATION: "📢 Evangelization",
+    SCCMinistry.YOUTH: "👦 Youth Ministry",
+    SCCMinistry.FAMILY: "👨‍👩‍👧‍👦 Family Ministry"
+})
+
+# SCC card columns, one template each; filled per card with format_map
+SCC_CARD_COLUMNS_MD = (
+    """
+**Location**: {location}  
+**Meeting Place**: {meeting_place}  
+**Neighborhood**: {neighborhood}
+""",
+    """
+**Coordinator**: {coordinator}  
+**Contact**: {contact}  
+**Established**: {established}
+""",
+    """
+**Families**: {families}  
+**Members**: {members}  
+**Youth**: {youth}
+""",
+)
+
+# Static page text, built once at import rather than on every rerun
+LUMKO_MD = """
+The **Lumko Method** is the most popular scripture reflection structure for SCCs in Africa:
+
+1. **Welcome & Opening Prayer** — Create a prayerful atmosphere
+2. **Psalm or Hymn** — Praise God together
+3. **Gospel Reading** — Read the scripture passage (usually Sunday's Gospel)
+4. **Meditation in Silence** — Allow the Word to speak to hearts
+5. **Sharing Reflections** — "What does this passage say to me/us?"
+6. **Action Commitment** — "What will we do this week because of this Word?"
+7. **Closing Prayer & Sending** — Go forth to live the Gospel
+
+**Why this works**: Combines listening to God's Word with practical action in daily life.
+"""
+
+NEW_SCC_GUIDE_MD = """
+### Step 1: Discernment & Prayer (Weeks 1-2)
+- Pray about forming an SCC in your neighborhood
+- Talk to your parish priest for blessing and guidance
+- Identify 3-5 families interested in joining
+
+### Step 2: Initial Gathering (Week 3)
+- Host an informal gathering at someone's home
+- Share the vision of SCCs
+- Discuss meeting schedule and location
+- Agree on scripture reflection method
+
+### Step 3: First Official Meetings (Weeks 4-8)
+- Meet weekly to establish rhythm
+- Keep meetings simple: prayer, Gospel, sharing
+- Rotate meeting locations among families
+- Build trust and community bonds
+
+### Step 4: Structure & Leadership (Weeks 9-12)
+- Select coordinator and other roles
+- Register with parish as official SCC
+- Join parish zone structure
+- Begin outreach to neighbors
+
+### Step 5: Mission & Growth (Ongoing)
+- Identify a social action project
+- Invite new families to join
+- Connect with other SCCs in zone
+- Participate in parish-wide SCC events
+
+**Remember**: Start small, pray consistently, act charitably. The rest will follow!
+"""
+
 # Data mode indicator
 st.info("📊 **Data Mode**: DEMO — Sample SCC data for demonstration", icon="ℹ️")
 
@@ -99,7 +174,7 @@ with st.expander(f"🗺️ {DEMO_ZONE.name} — {DEMO_ZONE.scc_count} SCCs"):
         st.markdown(f"""
         **Total Families**: {DEMO_ZONE.total_families}  
         **SCCs**: {DEMO_ZONE.scc_count}  
-        **Established**: {DEMO_ZONE.established_date.strftime('%B %Y')}
+        **Established**: {DEMO_ZONE.established_str}
         """)
 
 st.divider()
@@ -114,28 +189,21 @@ st.header("SCC Directory")
 with st.container():
     st.subheader(f"✝️ {DEMO_SCC.name}")
     
-    col1, col2, col3 = st.columns([2, 2, 1])
-    
-    with col1:
-        st.markdown(f"""
-        **Location**: {DEMO_SCC.location_description}  
-        **Meeting Place**: {DEMO_SCC.meeting_place}  
-        **Neighborhood**: {DEMO_SCC.neighborhood}
-        """)
-    
-    with col2:
-        st.markdown(f"""
-        **Coordinator**: {DEMO_SCC.coordinators[0].name}  
-        **Contact**: {DEMO_SCC.contact_phone}  
-        **Established**: {DEMO_SCC.established_date.strftime('%B %Y')}
-        """)
+    card = {
+        "location": DEMO_SCC.location_description,
+        "meeting_place": DEMO_SCC.meeting_place,
+        "neighborhood": DEMO_SCC.neighborhood,
+        "coordinator": DEMO_SCC.coordinators[0].name,
+        "contact": DEMO_SCC.contact_phone,
+        "established": DEMO_SCC.established_str,
+        "families": DEMO_SCC.family_count,
+        "members": DEMO_SCC.active_members_count,
+        "youth": DEMO_SCC.youth_count,
+    }
     
-    with col3:
-        st.markdown(f"""
-        **Families**: {DEMO_SCC.family_count}  
-        **Members**: {DEMO_SCC.active_members_count}  
-        **Youth**: {DEMO_SCC.youth_count}
-        """)
+    for column, template in zip(st.columns([2, 2, 1]), SCC_CARD_COLUMNS_MD, strict=True):
+        with column:
+            st.markdown(template.format_map(card))
     
     # Meeting schedule
     st.markdown("### 📅 Meeting Schedule")
@@ -143,38 +211,28 @@ with st.container():
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        st.info(f"**Every {DEMO_SCC.meeting_day}** at {DEMO_SCC.meeting_time.strftime('%I:%M %p')}")
+        st.info(f"**Every {DEMO_SCC.meeting_day}** at {DEMO_SCC.meeting_time_str}")
     
     with col2:
         if DEMO_SCC.last_meeting_date:
-            st.write(f"**Last Meeting**: {DEMO_SCC.last_meeting_date.strftime('%b %d, %Y')}")
+            st.write(f"**Last Meeting**: {DEMO_SCC.last_meeting_str}")
     
     with col3:
         if DEMO_SCC.upcoming_meeting_date:
-            st.success(f"**Next**: {DEMO_SCC.upcoming_meeting_date.strftime('%b %d, %Y')}")
+            st.success(f"**Next**: {DEMO_SCC.upcoming_meeting_str}")
     
     # Ministries
     st.markdown("### 🎯 Active Ministries")
     
-    ministry_display = {
-        SCCMinistry.PRAYER: "🙏 Prayer & Worship",
-        SCCMinistry.SOCIAL_ACTION: "🤝 Social Action",
-        SCCMinistry.FORMATION: "📚 Faith Formation",
-        SCCMinistry.EVANGELIZATION: "📢 Evangelization",
-        SCCMinistry.YOUTH: "👦 Youth Ministry",
-        SCCMinistry.FAMILY: "👨‍👩‍👧‍👦 Family Ministry"
-    }
-    
-    ministry_cols = st.columns(len(DEMO_SCC.active_ministries))
-    for idx, ministry in enumerate(DEMO_SCC.active_ministries):
-        with ministry_cols[idx]:
-            st.write(ministry_display.get(ministry, ministry.value))
+    st.markdown(" &nbsp;·&nbsp; ".join(
+        MINISTRY_LABEL.get(ministry, ministry.value)
+        for ministry in DEMO_SCC.active_ministries
+    ))
     
     # Social projects
     if DEMO_SCC.social_projects:
         st.markdown("### 🌍 Social Action Projects")
-        for project in DEMO_SCC.social_projects:
-            st.write(f"- {project}")
+        st.markdown("\n".join(f"- {p}" for p in DEMO_SCC.social_projects))
     
     # Reflection method
     st.markdown("### 📖 Scripture Reflection Method")
@@ -183,19 +241,7 @@ with st.container():
         st.success(f"✅ Uses {DEMO_SCC.scripture_reflection_method}")
         
         with st.expander("Learn about the 7-Step Lumko Method"):
-            st.markdown("""
-            The **Lumko Method** is the most popular scripture reflection structure for SCCs in Africa:
-            
-            1. **Welcome & Opening Prayer** — Create a prayerful atmosphere
-            2. **Psalm or Hymn** — Praise God together
-            3. **Gospel Reading** — Read the scripture passage (usually Sunday's Gospel)
-            4. **Meditation in Silence** — Allow the Word to speak to hearts
-            5. **Sharing Reflections** — "What does this passage say to me/us?"
-            6. **Action Commitment** — "What will we do this week because of this Word?"
-            7. **Closing Prayer & Sending** — Go forth to live the Gospel
-            
-            **Why this works**: Combines listening to God's Word with practical action in daily life.
-            """)
+            st.markdown(LUMKO_MD)
     else:
         st.info(f"Uses: {DEMO_SCC.scripture_reflection_method}")
 
@@ -266,11 +312,13 @@ with tab3:
         st.metric("Social Projects Active", len(DEMO_SCC.social_projects))
     
     with col2:
-        st.write("**Most Recent Activities**:")
-        st.write("- Feb 6: Weekly meeting (24 attendees)")
-        st.write("- Feb 3: Food bank collection")
-        st.write("- Jan 30: Weekly meeting (22 attendees)")
-        st.write("- Jan 28: Visit to elderly parishioners")
+        st.markdown("""
+        **Most Recent Activities**:
+        - Feb 6: Weekly meeting (24 attendees)
+        - Feb 3: Food bank collection
+        - Jan 30: Weekly meeting (22 attendees)
+        - Jan 28: Visit to elderly parishioners
+        """)
 
 st.divider()
 
@@ -281,38 +329,7 @@ st.divider()
 st.header("Starting a New SCC")
 
 with st.expander("📘 Guide to Forming a New Small Christian Community"):
-    st.markdown("""
-    ### Step 1: Discernment & Prayer (Weeks 1-2)
-    - Pray about forming an SCC in your neighborhood
-    - Talk to your parish priest for blessing and guidance
-    - Identify 3-5 families interested in joining
-    
-    ### Step 2: Initial Gathering (Week 3)
-    - Host an informal gathering at someone's home
-    - Share the vision of SCCs
-    - Discuss meeting schedule and location
-    - Agree on scripture reflection method
-    
-    ### Step 3: First Official Meetings (Weeks 4-8)
-    - Meet weekly to establish rhythm
-    - Keep meetings simple: prayer, Gospel, sharing
-    - Rotate meeting locations among families
-    - Build trust and community bonds
-    
-    ### Step 4: Structure & Leadership (Weeks 9-12)
-    - Select coordinator and other roles
-    - Register with parish as official SCC
-    - Join parish zone structure
-    - Begin outreach to neighbors
-    
-    ### Step 5: Mission & Growth (Ongoing)
-    - Identify a social action project
-    - Invite new families to join
-    - Connect with other SCCs in zone
-    - Participate in parish-wide SCC events
-    
-    **Remember**: Start small, pray consistently, act charitably. The rest will follow!
-    """)
+    st.markdown(NEW_SCC_GUIDE_MD)
 
 st.divider()
 
@@ -13,7 +13,9 @@ from pathlib import Path
 from datetime import datetime, timedelta
 
 # Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+ROOT = str(Path(__file__).resolve().parent.parent)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
 
 from src.spiritual_os.domain.catechist import (
     CatechistCertification,
@@ -12,16 +12,17 @@ Includes:
 
 import streamlit as st
 import sys
+import math
 from pathlib import Path
 from datetime import datetime
 
 # Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+ROOT = str(Path(__file__).resolve().parent.parent)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
 
 from src.spiritual_os.prayers import (
     PrayerLibrary,
-    PrayerCategory,
-    PrayerLanguage,
     JOYFUL_MYSTERIES,
     SORROWFUL_MYSTERIES,
     GLORIOUS_MYSTERIES,
@@ -35,6 +36,90 @@ st.set_page_config(
     layout="wide"
 )
 
+
+# Static page text, built once at import rather than on every rerun
+ROSARY_HOWTO_MD = """
+The Rosary is a powerful Marian prayer that meditates on the life of Christ through Mary's eyes.
+
+**How to Pray the Rosary**:
+1. Make the Sign of the Cross and say the Apostles' Creed
+2. Say the Our Father
+3. Say three Hail Marys (for Faith, Hope, and Charity)
+4. Say the Glory Be
+5. Announce the First Mystery and say the Our Father
+6. Say ten Hail Marys while meditating on the Mystery
+7. Say the Glory Be and (optional) Fatima Prayer
+8. Repeat steps 5-7 for remaining four Mysteries
+9. Conclude with Hail Holy Queen and closing prayers
+"""
+
+
+def _mystery_body(emoji: str, name: str, days: str, mysteries, meditation: str) -> str:
+    """Heading, schedule, numbered mysteries and meditation as one markdown blob"""
+    numbered = "\n".join(f"{i}. {m}" for i, m in enumerate(mysteries, 1))
+    return f"### {emoji} {name} Mysteries\n\n*Prayed on {days}*\n\n{numbered}\n{meditation}"
+
+
+MYSTERY_BODIES = {
+    "Joyful": _mystery_body("🌅", "Joyful", "Mondays and Saturdays", JOYFUL_MYSTERIES, """
+**Fruit of the Mysteries**: Joy, Humility, Charity, Obedience, Piety
+
+**Meditation**: The Joyful Mysteries invite us to contemplate the incarnation of Christ
+and Mary's role in salvation history. Through her "yes" (fiat), the Word became flesh.
+"""),
+    "Luminous": _mystery_body("💡", "Luminous", "Thursdays", LUMINOUS_MYSTERIES, """
+**Fruit of the Mysteries**: Openness to Holy Spirit, Faith, Conversion, Fortitude, Adoration
+
+**Meditation**: The Luminous Mysteries, introduced by Pope John Paul II in 2002,
+focus on Christ's public ministry and the revelation of his divinity.
+"""),
+    "Sorrowful": _mystery_body("😢", "Sorrowful", "Tuesdays and Fridays", SORROWFUL_MYSTERIES, """
+**Fruit of the Mysteries**: Contrition, Patience, Mortification, Obedience, Compassion
+
+**Meditation**: The Sorrowful Mysteries invite us to walk with Jesus in his Passion,
+experiencing the depths of God's love in the cross and redemptive suffering.
+"""),
+    "Glorious": _mystery_body("🌟", "Glorious", "Wednesdays and Sundays", GLORIOUS_MYSTERIES, """
+**Fruit of the Mysteries**: Faith, Hope, Wisdom, Devotion to Mary, Grace of Holy Death
+
+**Meditation**: The Glorious Mysteries celebrate the triumph of Christ over death
+and the glory that awaits those who remain faithful to him.
+"""),
+}
+
+PRAYERS_PER_PAGE = 10
+
+# Indexed by date.weekday(): 0=Monday, 6=Sunday
+MYSTERY_BY_WEEKDAY = (
+    "Joyful",     # Monday
+    "Sorrowful",  # Tuesday
+    "Glorious",   # Wednesday
+    "Luminous",   # Thursday
+    "Sorrowful",  # Friday
+    "Joyful",     # Saturday
+    "Glorious",   # Sunday
+)
+
+FATIMA_PRAYER_MD = """
+*O my Jesus, forgive us our sins, save us from the fires of hell, 
+and lead all souls to Heaven, especially those in most need of Thy mercy. Amen.*
+"""
+
+
+@st.cache_resource(show_spinner=False)
+def _basic_prayers(lang_code: str):
+    """Shared, read-only prayer list per language; no per-rerun copy"""
+    return PrayerLibrary.get_basic_prayers(lang_code)
+
+
+def _toggle_prayer(prayer_id: str):
+    """Open a prayer, or close it if it is already open"""
+    if st.session_state.get("open_prayer") == prayer_id:
+        st.session_state["open_prayer"] = None
+    else:
+        st.session_state["open_prayer"] = prayer_id
+
+
 # Data mode indicator
 st.info("📊 **Content Mode**: LIVE — Traditional Catholic prayers", icon="ℹ️")
 
@@ -47,22 +132,6 @@ Pray these daily to grow in relationship with God and deepen your faith.
 *"Prayer is the raising of one's mind and heart to God." — St. John Damascene*
 """)
 
-# Language selector
-language = st.selectbox(
-    "Select Language",
-    ["English", "Latin", "Swahili"],
-    help="Choose your preferred prayer language"
-)
-
-language_map = {
-    "English": "en",
-    "Latin": "la",
-    "Swahili": "sw"
-}
-lang_code = language_map[language]
-
-st.divider()
-
 # ============================================================================
 # BASIC PRAYERS
 # ============================================================================
@@ -74,25 +143,63 @@ These are the foundational prayers every Catholic should know.
 Pray them daily, teach them to children, and use them throughout the day.
 """)
 
-basic_prayers = PrayerLibrary.get_basic_prayers(lang_code)
-
-for prayer in basic_prayers:
-    with st.expander(f"✝️ {prayer.title}"):
-        st.markdown(f"### {prayer.title}")
-        
-        # Prayer text
-        prayer_text = prayer.text.get(lang_code, prayer.text.get("en", "Translation not available"))
-        st.markdown(f"*{prayer_text}*")
-        
-        # Additional info
-        if prayer.biblical_reference:
-            st.caption(f"📖 Biblical Reference: {prayer.biblical_reference}")
-        
-        if prayer.when_to_pray:
-            st.caption(f"⏰ When to Pray: {prayer.when_to_pray}")
+# Language changes and prayer toggles rerun only this section
+@st.fragment
+def _basic_prayers_section():
+    language = st.selectbox(
+        "Select Language",
+        ["English", "Latin", "Swahili"],
+        help="Choose your preferred prayer language"
+    )
+    
+    language_map = {
+        "English": "en",
+        "Latin": "la",
+        "Swahili": "sw"
+    }
+    lang_code = language_map[language]
+    
+    basic_prayers = _basic_prayers(lang_code)
+    
+    # Only one page of prayers is rendered; the pager appears once the list outgrows it
+    page_count = math.ceil(len(basic_prayers) / PRAYERS_PER_PAGE)
+    page = 1
+    if page_count > 1:
+        page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1)
+    start = (page - 1) * PRAYERS_PER_PAGE
+    
+    for prayer in basic_prayers[start:start + PRAYERS_PER_PAGE]:
+        st.button(
+            f"✝️ {prayer.title}",
+            key=f"tog_{prayer.id}",
+            on_click=_toggle_prayer,
+            args=(prayer.id,),
+            use_container_width=True,
+        )
         
-        if prayer.notes:
-            st.info(prayer.notes)
+        # Only the open prayer's body is rendered; the rest stay as a title button
+        if st.session_state.get("open_prayer") == prayer.id:
+            st.markdown(f"### {prayer.title}")
+            
+            # Prayer text is plain with line breaks, so skip the markdown renderer
+            prayer_text = prayer.text.get(lang_code, prayer.text.get("en", "Translation not available"))
+            with st.container(border=True):
+                st.text(prayer_text)
+            
+            # Additional info, as one caption line
+            details = []
+            if prayer.biblical_reference:
+                details.append(f"📖 Biblical Reference: {prayer.biblical_reference}")
+            if prayer.when_to_pray:
+                details.append(f"⏰ When to Pray: {prayer.when_to_pray}")
+            if details:
+                st.caption(" · ".join(details))
+            
+            if prayer.notes:
+                st.info(prayer.notes)
+
+
+_basic_prayers_section()
 
 st.divider()
 
@@ -102,100 +209,30 @@ st.divider()
 
 st.header("🌹 The Holy Rosary")
 
-st.markdown("""
-The Rosary is a powerful Marian prayer that meditates on the life of Christ through Mary's eyes.
-
-**How to Pray the Rosary**:
-1. Make the Sign of the Cross and say the Apostles' Creed
-2. Say the Our Father
-3. Say three Hail Marys (for Faith, Hope, and Charity)
-4. Say the Glory Be
-5. Announce the First Mystery and say the Our Father
-6. Say ten Hail Marys while meditating on the Mystery
-7. Say the Glory Be and (optional) Fatima Prayer
-8. Repeat steps 5-7 for remaining four Mysteries
-9. Conclude with Hail Holy Queen and closing prayers
-""")
+st.markdown(ROSARY_HOWTO_MD)
 
 # Determine today's mysteries
 today = datetime.now()
 weekday = today.weekday()  # 0=Monday, 6=Sunday
 
-mystery_schedule = {
-    0: ("Joyful", JOYFUL_MYSTERIES),      # Monday
-    1: ("Sorrowful", SORROWFUL_MYSTERIES), # Tuesday
-    2: ("Glorious", GLORIOUS_MYSTERIES),   # Wednesday
-    3: ("Luminous", LUMINOUS_MYSTERIES),   # Thursday
-    4: ("Sorrowful", SORROWFUL_MYSTERIES), # Friday
-    5: ("Joyful", JOYFUL_MYSTERIES),       # Saturday
-    6: ("Glorious", GLORIOUS_MYSTERIES),   # Sunday
-}
-
-mystery_name, mysteries = mystery_schedule[weekday]
+mystery_name = MYSTERY_BY_WEEKDAY[weekday]
 
 st.success(f"**Today's Mysteries**: {mystery_name} Mysteries ({today.strftime('%A')})")
 
-# Display mysteries
-tab1, tab2, tab3, tab4 = st.tabs(["Joyful", "Luminous", "Sorrowful", "Glorious"])
-
-with tab1:
-    st.markdown("### 🌅 Joyful Mysteries")
-    st.caption("*Prayed on Mondays and Saturdays*")
-    for i, mystery in enumerate(JOYFUL_MYSTERIES, 1):
-        st.write(f"{i}. {mystery}")
-    
-    st.markdown("""
-    **Fruit of the Mysteries**: Joy, Humility, Charity, Obedience, Piety
-    
-    **Meditation**: The Joyful Mysteries invite us to contemplate the incarnation of Christ
-    and Mary's role in salvation history. Through her "yes" (fiat), the Word became flesh.
-    """)
-
-with tab2:
-    st.markdown("### 💡 Luminous Mysteries")
-    st.caption("*Prayed on Thursdays*")
-    for i, mystery in enumerate(LUMINOUS_MYSTERIES, 1):
-        st.write(f"{i}. {mystery}")
-    
-    st.markdown("""
-    **Fruit of the Mysteries**: Openness to Holy Spirit, Faith, Conversion, Fortitude, Adoration
-    
-    **Meditation**: The Luminous Mysteries, introduced by Pope John Paul II in 2002,
-    focus on Christ's public ministry and the revelation of his divinity.
-    """)
-
-with tab3:
-    st.markdown("### 😢 Sorrowful Mysteries")
-    st.caption("*Prayed on Tuesdays and Fridays*")
-    for i, mystery in enumerate(SORROWFUL_MYSTERIES, 1):
-        st.write(f"{i}. {mystery}")
-    
-    st.markdown("""
-    **Fruit of the Mysteries**: Contrition, Patience, Mortification, Obedience, Compassion
-    
-    **Meditation**: The Sorrowful Mysteries invite us to walk with Jesus in his Passion,
-    experiencing the depths of God's love in the cross and redemptive suffering.
-    """)
-
-with tab4:
-    st.markdown("### 🌟 Glorious Mysteries")
-    st.caption("*Prayed on Wednesdays and Sundays*")
-    for i, mystery in enumerate(GLORIOUS_MYSTERIES, 1):
-        st.write(f"{i}. {mystery}")
-    
-    st.markdown("""
-    **Fruit of the Mysteries**: Faith, Hope, Wisdom, Devotion to Mary, Grace of Holy Death
-    
-    **Meditation**: The Glorious Mysteries celebrate the triumph of Christ over death
-    and the glory that awaits those who remain faithful to him.
-    """)
+# Only the selected set of mysteries is rendered; defaults to today's
+selected_mysteries = st.radio(
+    "Mysteries",
+    list(MYSTERY_BODIES),
+    index=list(MYSTERY_BODIES).index(mystery_name),
+    horizontal=True,
+    label_visibility="collapsed",
+    key="rosary_mysteries"
+)
+st.markdown(MYSTERY_BODIES[selected_mysteries])
 
 # Fatima Prayer
 st.markdown("### 💫 Fatima Prayer (After Each Decade)")
-st.info("""
-*O my Jesus, forgive us our sins, save us from the fires of hell, 
-and lead all souls to Heaven, especially those in most need of Thy mercy. Amen.*
-""")
+st.info(FATIMA_PRAYER_MD)
 
 st.divider()
 
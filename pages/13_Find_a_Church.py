@@ -12,16 +12,11 @@ import sys
 from pathlib import Path
 
 # Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-from src.spiritual_os.church_directory import (
-    Church,
-    ChurchDirectory,
-    ChurchType,
-    MassLanguage,
-    WelcomeLevel,
-    DEMO_CHURCHES
-)
+ROOT = str(Path(__file__).resolve().parent.parent)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from src.spiritual_os.church_directory import ChurchDirectory, MassLanguage
 
 # Page config
 st.set_page_config(
@@ -92,8 +87,7 @@ elif search_type == "By Language":
     )
     
     if st.button("Search", type="primary"):
-        lang_enum = [l for l in MassLanguage if l.value == language][0]
-        results = ChurchDirectory.search_by_language(lang_enum)
+        results = ChurchDirectory.search_by_language(MassLanguage(language))
 
 elif search_type == "By Name":
     church_name = st.text_input(
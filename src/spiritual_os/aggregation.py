@@ -3,70 +3,225 @@ Aggregation Logic - Compute aggregates from individual data
 Runs on a schedule to update parish/diocese/global aggregates
 """
 
-from typing import List, Dict, Optional
-from src.spiritual_os.models import User, Parish, Diocese, JusticeCampaign
+import json
+import os
+import sqlite3
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import chain
+from pathlib import Path
+from types import MappingProxyType
+from typing import Iterable, Iterator, List, Dict, Optional, Union
+from src.spiritual_os.models import User, Parish, Diocese, JusticeCampaign, UserRole
 
 
-class AggregationEngine:
-    """Compute aggregates from detailed user data"""
+# Role dispatch for QueryBuilder, keyed by UserRole: (entity, requesting_user) -> visible?
+# Roles missing from a table see nothing at that level.
+_VISIBLE_USER = MappingProxyType({
+    # Individuals can only see themselves
+    UserRole.INDIVIDUAL: lambda u, r: u.id == r.id,
+    # Coordinators see all users in their parish (but only aggregates, not details)
+    UserRole.PARISH_COORDINATOR: lambda u, r: u.parish_id == r.parish_id,
+    # Leaders see all users in diocese (aggregated)
+    UserRole.DIOCESAN_LEADER: lambda u, r: u.diocese_id == r.diocese_id,
+})
+
+# Roles whose visible rows are one build_indexes bucket: (index name, user attribute)
+_USER_INDEX = MappingProxyType({
+    UserRole.INDIVIDUAL: ("users_by_id", "id"),
+    UserRole.PARISH_COORDINATOR: ("users_by_parish", "parish_id"),
+    UserRole.DIOCESAN_LEADER: ("users_by_diocese", "diocese_id"),
+})
+
+_VISIBLE_PARISH = MappingProxyType({
+    # Individuals and coordinators see their own parish only
+    UserRole.INDIVIDUAL: lambda p, r: p.id == r.parish_id,
+    UserRole.PARISH_COORDINATOR: lambda p, r: p.id == r.parish_id,
+    # Leaders see all parishes in their diocese
+    UserRole.DIOCESAN_LEADER: lambda p, r: p.diocese_id == r.diocese_id,
+    UserRole.GLOBAL_COORDINATOR: lambda p, r: True,
+})
+
+_PARISH_INDEX = MappingProxyType({
+    UserRole.INDIVIDUAL: ("parishes_by_id", "parish_id"),
+    UserRole.PARISH_COORDINATOR: ("parishes_by_id", "parish_id"),
+    UserRole.DIOCESAN_LEADER: ("parishes_by_diocese", "diocese_id"),
+})
+
+_CAMPAIGN_ROLES = frozenset({
+    UserRole.INDIVIDUAL,
+    UserRole.PARISH_COORDINATOR,
+    UserRole.DIOCESAN_LEADER,
+    UserRole.GLOBAL_COORDINATOR,
+})
+
+
+# Below this many users, process start-up costs more than the scan saves
+PARALLEL_MIN_USERS = 50_000
+
+# Materialized diocese aggregates, refreshed only when a diocese's version moves
+AGGREGATES_DB = Path(".data/aggregates.db")
+
+
+@dataclass
+class _PartialAgg:
+    """Running parish totals; distributive, so shards merge by addition"""
+    members: int = 0
+    formation: int = 0
+    total_minutes: int = 0
+    practice_count: int = 0
+    sacraments: Counter = field(default_factory=Counter)
     
-    @staticmethod
-    def aggregate_parish_from_users(users: List[User], parish: Parish) -> Parish:
-        """
-        Compute parish aggregates from all users who opted in
-        """
-        # Filter users in this parish who opted in
-        parish_users = [
-            u for u in users 
-            if u.parish_id == parish.id and u.opt_in_to_parish_aggregates
-        ]
+    def add_users(self, users: List[User]):
+        """Fold a batch of opted-in users into the totals"""
+        self.members += len(users)
         
-        if not parish_users:
+        # Formation participants are people with a Rule of Life; partition
+        # once so the entries loop below carries no per-user branch
+        with_rule = [u for u in users if u.rule_of_life]
+        self.formation += len(with_rule)
+        
+        # Assume rule has "entries" list with "duration_minutes"
+        for entry in chain.from_iterable(u.rule_of_life.get("entries", ()) for u in with_rule):
+            self.total_minutes += entry.get("duration_minutes", 0)
+            self.practice_count += 1
+        
+        # Sacrament stats (aggregate counts)
+        self.sacraments.update(
+            milestone.get("name", "Unknown")
+            for milestone in chain.from_iterable(u.sacrament_milestones for u in users)
+        )
+    
+    def merge(self, other: "_PartialAgg"):
+        """Add another shard's totals for the same parish"""
+        self.members += other.members
+        self.formation += other.formation
+        self.total_minutes += other.total_minutes
+        self.practice_count += other.practice_count
+        self.sacraments += other.sacraments
+    
+    def apply_to(self, parish: Parish) -> Parish:
+        """Write the totals onto the parish's aggregate fields"""
+        if self.members == 0:
             parish.aggregated_members_count = 0
             parish.aggregated_formation_participants = 0
             parish.aggregated_avg_practice_minutes = 0.0
             return parish
         
-        # Count members
-        parish.aggregated_members_count = len(parish_users)
-        
-        # Count formation participants (people with Rule of Life)
-        formation_participants = sum(
-            1 for u in parish_users 
-            if u.rule_of_life and len(u.rule_of_life) > 0
-        )
-        parish.aggregated_formation_participants = formation_participants
+        parish.aggregated_members_count = self.members
+        parish.aggregated_formation_participants = self.formation
         
         # Average practice time
-        total_minutes = 0
-        practice_count = 0
-        for user in parish_users:
-            if user.rule_of_life:
-                # Assume rule has "entries" list with "duration_minutes"
-                for entry in user.rule_of_life.get("entries", []):
-                    total_minutes += entry.get("duration_minutes", 0)
-                    practice_count += 1
-        
-        if practice_count > 0:
-            parish.aggregated_avg_practice_minutes = total_minutes / practice_count
+        if self.practice_count > 0:
+            parish.aggregated_avg_practice_minutes = self.total_minutes / self.practice_count
         
-        # Sacrament stats (aggregate counts)
-        sacrament_counts = {}
-        for user in parish_users:
-            for milestone in user.sacrament_milestones:
-                sacrament_type = milestone.get("name", "Unknown")
-                sacrament_counts[sacrament_type] = sacrament_counts.get(sacrament_type, 0) + 1
+        parish.aggregated_sacrament_stats = dict(self.sacraments)
+        return parish
+
+
+def _shard_aggregate(users: List[User]) -> Dict[str, _PartialAgg]:
+    """Per-parish partial totals for one slice of users (worker entry point)"""
+    partials = {}
+    for parish_id, parish_users in AggregationEngine.build_user_index(users).items():
+        partials[parish_id] = partial = _PartialAgg()
+        partial.add_users(parish_users)
+    return partials
+
+
+class AggregationEngine:
+    """Compute aggregates from detailed user data"""
+    
+    @staticmethod
+    def build_user_index(users: List[User]) -> Dict[str, List[User]]:
+        """
+        Partition opted-in users by parish_id in one pass
+        
+        Pass the result to aggregate_parish_from_users instead of the raw
+        list so each parish reads its own users rather than scanning all.
+        """
+        index = defaultdict(list)
+        for user in users:
+            if user.opt_in_to_parish_aggregates:
+                index[user.parish_id].append(user)
+        return dict(index)
+    
+    @staticmethod
+    def build_parish_index(parishes: List[Parish]) -> Dict[str, List[Parish]]:
+        """Partition parishes by diocese_id in one pass"""
+        index = defaultdict(list)
+        for parish in parishes:
+            index[parish.diocese_id].append(parish)
+        return dict(index)
+    
+    @staticmethod
+    def aggregate_parish_from_users(
+        users: Union[List[User], Dict[str, List[User]]],
+        parish: Parish
+    ) -> Parish:
+        """
+        Compute parish aggregates from all users who opted in
         
-        parish.aggregated_sacrament_stats = sacrament_counts
+        users may be the full user list or an index from build_user_index.
+        """
+        if isinstance(users, dict):
+            users = users.get(parish.id, [])
         
-        return parish
+        partial = _PartialAgg()
+        partial.add_users([
+            u for u in users
+            if u.parish_id == parish.id and u.opt_in_to_parish_aggregates
+        ])
+        
+        return partial.apply_to(parish)
+    
+    @staticmethod
+    def aggregate_all_parishes(
+        users: List[User],
+        parishes: List[Parish],
+        max_workers: Optional[int] = None
+    ) -> List[Parish]:
+        """
+        Aggregate every parish from one pass over users
+        
+        Large user lists are split across worker processes, each building
+        per-parish partial counts; counts and sums merge by addition.
+        """
+        if len(users) < PARALLEL_MIN_USERS:
+            partials = _shard_aggregate(users)
+        else:
+            workers = max_workers or os.cpu_count() or 1
+            chunk_size = -(-len(users) // workers)
+            chunks = [users[i:i + chunk_size] for i in range(0, len(users), chunk_size)]
+            
+            partials = {}
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for shard in executor.map(_shard_aggregate, chunks):
+                    for parish_id, partial in shard.items():
+                        if parish_id in partials:
+                            partials[parish_id].merge(partial)
+                        else:
+                            partials[parish_id] = partial
+        
+        return [
+            partials.get(parish.id, _PartialAgg()).apply_to(parish)
+            for parish in parishes
+        ]
     
     @staticmethod
-    def aggregate_diocese_from_parishes(parishes: List[Parish], diocese: Diocese) -> Diocese:
+    def aggregate_diocese_from_parishes(
+        parishes: Union[List[Parish], Dict[str, List[Parish]]],
+        diocese: Diocese
+    ) -> Diocese:
         """
         Compute diocese aggregates from all parishes
+        
+        parishes may be the full list or an index from build_parish_index.
         """
-        diocese_parishes = [p for p in parishes if p.diocese_id == diocese.id]
+        if isinstance(parishes, dict):
+            diocese_parishes = parishes.get(diocese.id, [])
+        else:
+            diocese_parishes = [p for p in parishes if p.diocese_id == diocese.id]
         
         if not diocese_parishes:
             return diocese
@@ -87,6 +242,15 @@ class AggregationEngine:
         
         return diocese
     
+    @staticmethod
+    def aggregate_all_dioceses(parishes: List[Parish], dioceses: List[Diocese]) -> List[Diocese]:
+        """Aggregate every diocese from one diocese_id partition of parishes"""
+        index = AggregationEngine.build_parish_index(parishes)
+        return [
+            AggregationEngine.aggregate_diocese_from_parishes(index, diocese)
+            for diocese in dioceses
+        ]
+    
     @staticmethod
     def aggregate_campaign_impact(
         campaign: JusticeCampaign,
@@ -109,84 +273,209 @@ class AggregationEngine:
         total_income_increase = 0
         total_policy_wins = 0
         
-        for diocese_id in campaign.dioceses_joined:
-            if diocese_id in diocese_data:
-                data = diocese_data[diocese_id]
-                workers = data.get("workers", 0)
-                wage_pct = data.get("wage_increase_percent", 0)
-                
-                total_workers += workers
-                total_wage_increase += wage_pct
-                total_income_increase += int(workers * wage_pct * 500)  # Rough estimate: $500 per % increase
-                total_policy_wins += data.get("policy_wins", 0)
+        # One dict probe per diocese; the arithmetic itself is negligible
+        for data in map(diocese_data.get, campaign.dioceses_joined):
+            if data is None:
+                continue
+            workers = data.get("workers", 0)
+            wage_pct = data.get("wage_increase_percent", 0)
+            
+            total_workers += workers
+            total_wage_increase += wage_pct
+            total_income_increase += int(workers * wage_pct * 500)  # Rough estimate: $500 per % increase
+            total_policy_wins += data.get("policy_wins", 0)
         
         campaign.aggregated_workers_affected = total_workers
         
-        if campaign.dioceses_joined:
-            campaign.aggregated_wage_increase_percent = total_wage_increase / len(campaign.dioceses_joined)
+        # Averaged over every joined diocese, including ones without data yet
+        campaign.aggregated_wage_increase_percent = total_wage_increase / len(campaign.dioceses_joined)
         
         campaign.aggregated_income_increase_dollars = total_income_increase
         campaign.aggregated_policy_wins = total_policy_wins
         
         return campaign
+    
+    @staticmethod
+    def refresh_materialized(
+        dioceses: List[Diocese],
+        parishes: List[Parish],
+        version_map: Dict[str, int],
+        store_path: Path = AGGREGATES_DB
+    ) -> int:
+        """
+        Recompute stored diocese aggregates whose version has moved on
+        
+        version_map: {diocese_id: version}, bumped by whatever changes a
+        diocese's parishes. Dioceses at or below their stored version are
+        skipped. Returns the number of rows rewritten.
+        """
+        Path(store_path).parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(store_path)
+        try:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS diocese_aggregates (
+                    diocese_id TEXT PRIMARY KEY,
+                    version INTEGER NOT NULL,
+                    aggregates TEXT NOT NULL
+                )
+            """)
+            stored = dict(conn.execute("SELECT diocese_id, version FROM diocese_aggregates"))
+            
+            stale = [
+                d for d in dioceses
+                if version_map.get(d.id, 0) > stored.get(d.id, -1)
+            ]
+            if not stale:
+                return 0
+            
+            index = AggregationEngine.build_parish_index(parishes)
+            rows = []
+            for diocese in stale:
+                AggregationEngine.aggregate_diocese_from_parishes(index, diocese)
+                rows.append((
+                    diocese.id,
+                    version_map.get(diocese.id, 0),
+                    json.dumps(diocese.to_aggregated_dict()),
+                ))
+            
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO diocese_aggregates VALUES (?, ?, ?)",
+                    rows
+                )
+        finally:
+            conn.close()
+        
+        return len(rows)
+    
+    @staticmethod
+    def get_diocese_aggregate(
+        diocese_id: str,
+        store_path: Path = AGGREGATES_DB
+    ) -> Optional[Dict]:
+        """
+        Materialized aggregates for one diocese, or None if never refreshed
+        
+        Read from the store on every call (a primary-key lookup): the store
+        may be refreshed by another process, so nothing is cached here.
+        """
+        if not Path(store_path).exists():
+            return None
+        conn = sqlite3.connect(store_path)
+        try:
+            row = conn.execute(
+                "SELECT aggregates FROM diocese_aggregates WHERE diocese_id = ?",
+                (diocese_id,)
+            ).fetchone()
+        except sqlite3.OperationalError:
+            # Store exists but has never been refreshed
+            return None
+        finally:
+            conn.close()
+        return json.loads(row[0]) if row else None
 
 
 class QueryBuilder:
     """Build permission-aware queries based on user role"""
     
     @staticmethod
-    def get_visible_users(
+    def build_indexes(
         all_users: List[User],
+        all_parishes: List[Parish]
+    ) -> Dict[str, Dict[str, list]]:
+        """
+        Partition users and parishes once for repeated visibility queries
+        
+        Returns {"users_by_id", "users_by_parish", "users_by_diocese",
+        "parishes_by_id", "parishes_by_diocese"}, each mapping an id to the
+        entities under it. Unlike
+        AggregationEngine.build_user_index, this ignores aggregate opt-ins.
+        """
+        users_by_id = defaultdict(list)
+        users_by_parish = defaultdict(list)
+        users_by_diocese = defaultdict(list)
+        for user in all_users:
+            users_by_id[user.id].append(user)
+            users_by_parish[user.parish_id].append(user)
+            users_by_diocese[user.diocese_id].append(user)
+        
+        parishes_by_id = defaultdict(list)
+        for parish in all_parishes:
+            parishes_by_id[parish.id].append(parish)
+        
+        return {
+            "users_by_id": dict(users_by_id),
+            "users_by_parish": dict(users_by_parish),
+            "users_by_diocese": dict(users_by_diocese),
+            "parishes_by_id": dict(parishes_by_id),
+            "parishes_by_diocese": AggregationEngine.build_parish_index(all_parishes),
+        }
+    
+    @staticmethod
+    def iter_visible_users(
+        all_users: Iterable[User],
         requesting_user: User,
         permission_context
+    ) -> Iterator[User]:
+        """Lazily yield users visible to requesting_user, for streaming callers"""
+        visible = _VISIBLE_USER.get(permission_context.role)
+        if visible is None:
+            return iter(())
+        return (u for u in all_users if visible(u, requesting_user))
+    
+    @staticmethod
+    def get_visible_users(
+        all_users: List[User],
+        requesting_user: User,
+        permission_context,
+        indexes: Optional[Dict[str, Dict[str, list]]] = None
     ) -> List[User]:
-        """Return users visible to requesting_user based on permissions"""
-        visible = []
-        
-        if permission_context.role.value == "individual":
-            # Individuals can only see themselves
-            visible = [u for u in all_users if u.id == requesting_user.id]
-        
-        elif permission_context.role.value == "parish_coordinator":
-            # Coordinators see all users in their parish (but only aggregates, not details)
-            visible = [u for u in all_users if u.parish_id == requesting_user.parish_id]
-        
-        elif permission_context.role.value == "diocesan_leader":
-            # Leaders see all users in diocese (aggregated)
-            visible = [u for u in all_users if u.diocese_id == requesting_user.diocese_id]
+        """
+        Return users visible to requesting_user based on permissions
         
-        else:
-            # Global/crisis: no direct user view
-            visible = []
+        indexes, from build_indexes, narrows the rows to the requesting
+        user's own bucket before any per-row check, so no role scans the
+        full list.
+        """
+        indexed = _USER_INDEX.get(permission_context.role)
+        if indexes is not None and indexed is not None:
+            index_name, attr = indexed
+            return list(indexes[index_name].get(getattr(requesting_user, attr), []))
         
-        return visible
+        return list(QueryBuilder.iter_visible_users(all_users, requesting_user, permission_context))
+    
+    @staticmethod
+    def iter_visible_parishes(
+        all_parishes: Iterable[Parish],
+        requesting_user: User,
+        permission_context
+    ) -> Iterator[Parish]:
+        """Lazily yield parishes visible to requesting_user"""
+        visible = _VISIBLE_PARISH.get(permission_context.role)
+        if visible is None:
+            return iter(())
+        return (p for p in all_parishes if visible(p, requesting_user))
     
     @staticmethod
     def get_visible_parishes(
         all_parishes: List[Parish],
         requesting_user: User,
-        permission_context
+        permission_context,
+        indexes: Optional[Dict[str, Dict[str, list]]] = None
     ) -> List[Parish]:
-        """Return parishes visible to requesting_user"""
-        visible = []
-        
-        if permission_context.role.value == "individual":
-            # See your parish only
-            visible = [p for p in all_parishes if p.id == requesting_user.parish_id]
-        
-        elif permission_context.role.value == "parish_coordinator":
-            # See your parish only
-            visible = [p for p in all_parishes if p.id == requesting_user.parish_id]
+        """Return parishes visible to requesting_user, via indexes if given"""
+        role = permission_context.role
         
-        elif permission_context.role.value == "diocesan_leader":
-            # See all parishes in your diocese
-            visible = [p for p in all_parishes if p.diocese_id == requesting_user.diocese_id]
-        
-        elif permission_context.role.value == "global_coordinator":
+        if role is UserRole.GLOBAL_COORDINATOR:
             # See all parishes (aggregated only)
-            visible = all_parishes
+            return all_parishes
+        
+        indexed = _PARISH_INDEX.get(role)
+        if indexes is not None and indexed is not None:
+            index_name, attr = indexed
+            return list(indexes[index_name].get(getattr(requesting_user, attr), []))
         
-        return visible
+        return list(QueryBuilder.iter_visible_parishes(all_parishes, requesting_user, permission_context))
     
     @staticmethod
     def get_visible_dioceses(
@@ -195,21 +484,18 @@ class QueryBuilder:
         permission_context
     ) -> List[Diocese]:
         """Return dioceses visible to requesting_user"""
-        visible = []
+        role = permission_context.role
         
-        if permission_context.role.value in ["individual", "parish_coordinator"]:
-            # Don't see diocese-level data directly
-            visible = []
+        if role is UserRole.GLOBAL_COORDINATOR:
+            # See all dioceses (aggregated)
+            return all_dioceses
         
-        elif permission_context.role.value == "diocesan_leader":
+        if role is UserRole.DIOCESAN_LEADER:
             # See your diocese
-            visible = [d for d in all_dioceses if d.id == requesting_user.diocese_id]
+            return [d for d in all_dioceses if d.id == requesting_user.diocese_id]
         
-        elif permission_context.role.value == "global_coordinator":
-            # See all dioceses (aggregated)
-            visible = all_dioceses
-        
-        return visible
+        # Individuals and coordinators don't see diocese-level data directly
+        return []
     
     @staticmethod
     def get_visible_campaigns(
@@ -218,18 +504,7 @@ class QueryBuilder:
         permission_context
     ) -> List[JusticeCampaign]:
         """Return campaigns visible to requesting_user"""
-        visible = []
-        
-        if permission_context.role.value in ["individual", "parish_coordinator"]:
-            # Limited access to campaigns (maybe through parish)
-            visible = all_campaigns  # Show all but aggregated view
-        
-        elif permission_context.role.value == "diocesan_leader":
-            # See all campaigns
-            visible = all_campaigns
-        
-        elif permission_context.role.value == "global_coordinator":
-            # See all campaigns in detail
-            visible = all_campaigns
-        
-        return visible
+        # Individuals and coordinators get the aggregated view, leaders the detail
+        if permission_context.role in _CAMPAIGN_ROLES:
+            return all_campaigns
+        return []
@@ -4,98 +4,245 @@ Simple, privacy-first auth system for nested architecture
 """
 
 import streamlit as st
-from typing import Optional, Tuple
+from collections import defaultdict
+from types import MappingProxyType
+from typing import Iterable, Iterator, Mapping, Optional, Tuple, Union
+import base64
 import hashlib
+import hmac
 import json
+import os
+import sqlite3
+import uuid
 from pathlib import Path
 
 
+# Static login-screen table; built once rather than on every rerun
+DEMO_ACCOUNTS = MappingProxyType({
+    "Individual": MappingProxyType({"email": "john@example.com", "password": "demo"}),
+    "Parish Coordinator": MappingProxyType({"email": "sarah@example.com", "password": "demo"}),
+    "Diocesan Leader": MappingProxyType({"email": "bishop@example.com", "password": "demo"}),
+    "Global Coordinator": MappingProxyType({"email": "global@example.com", "password": "demo"}),
+    "Crisis Responder": MappingProxyType({"email": "crisis@example.com", "password": "demo"}),
+})
+
+# Permission tables for PermissionManager, keyed by role string
+_LENS_ACCESS = MappingProxyType({
+    "individual": frozenset({"personal", "parish"}),
+    "parish_coordinator": frozenset({"personal", "parish", "diocese"}),
+    "diocesan_leader": frozenset({"personal", "parish", "diocese", "global"}),
+    "global_coordinator": frozenset({"personal", "parish", "diocese", "global"}),
+    "crisis_responder": frozenset({"crisis", "personal", "parish"}),
+})
+_CRISIS_ROLES = frozenset({"diocesan_leader", "crisis_responder"})
+_CAMPAIGN_DETAIL_ROLES = frozenset({"diocesan_leader", "global_coordinator"})
+
+
 class Authentication:
     """Handle user authentication"""
     
-    AUTH_FILE = Path(".data/auth.json")
+    AUTH_DB = Path(".data/auth.db")
+    
+    # Pre-SQLite account store; imported into AUTH_DB once, then retired
+    LEGACY_AUTH_FILE = Path(".data/auth.json")
+    
+    # Row shape returned by login, matching the dict the app stores in session
+    USER_FIELDS = ("name", "email", "role", "parish_id", "diocese_id", "password_hash")
     
     @staticmethod
     def init_auth_system():
         """Initialize authentication system with demo accounts"""
-        Authentication.AUTH_FILE.parent.mkdir(parents=True, exist_ok=True)
+        Authentication.AUTH_DB.parent.mkdir(parents=True, exist_ok=True)
+        
+        demo_users = [
+            ("user_001", "John Smith", "john@example.com", "individual",
+             "parish_001", "diocese_001"),
+            ("coord_001", "Sarah Johnson", "sarah@example.com", "parish_coordinator",
+             "parish_001", "diocese_001"),
+            ("bishop_001", "Bishop Michael", "bishop@example.com", "diocesan_leader",
+             None, "diocese_001"),
+            ("global_001", "Justice Network Lead", "global@example.com", "global_coordinator",
+             None, None),
+            ("crisis_001", "Crisis Responder", "crisis@example.com", "crisis_responder",
+             "parish_001", "diocese_001"),
+        ]
+        
+        conn = sqlite3.connect(Authentication.AUTH_DB)
+        cursor = conn.cursor()
+        
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS users (
+                id TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                email TEXT NOT NULL UNIQUE,
+                role TEXT NOT NULL,
+                parish_id TEXT,
+                diocese_id TEXT,
+                password_hash TEXT NOT NULL
+            )
+        """)
+        
+        Authentication._import_legacy_users(conn)
+        
+        # Each hash is a deliberate scrypt cost, so only hash accounts not yet seeded
+        existing = {row[0] for row in cursor.execute("SELECT id FROM users")}
+        cursor.executemany(
+            "INSERT OR IGNORE INTO users VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [row + (Authentication._hash_password("demo"),)
+             for row in demo_users if row[0] not in existing]
+        )
         
-        demo_users = {
-            "user_001": {
-                "name": "John Smith",
-                "email": "john@example.com",
-                "role": "individual",
-                "parish_id": "parish_001",
-                "diocese_id": "diocese_001",
-                "password_hash": Authentication._hash_password("demo"),
-            },
-            "coord_001": {
-                "name": "Sarah Johnson",
-                "email": "sarah@example.com",
-                "role": "parish_coordinator",
-                "parish_id": "parish_001",
-                "diocese_id": "diocese_001",
-                "password_hash": Authentication._hash_password("demo"),
-            },
-            "bishop_001": {
-                "name": "Bishop Michael",
-                "email": "bishop@example.com",
-                "role": "diocesan_leader",
-                "parish_id": None,
-                "diocese_id": "diocese_001",
-                "password_hash": Authentication._hash_password("demo"),
-            },
-            "global_001": {
-                "name": "Justice Network Lead",
-                "email": "global@example.com",
-                "role": "global_coordinator",
-                "parish_id": None,
-                "diocese_id": None,
-                "password_hash": Authentication._hash_password("demo"),
-            },
-            "crisis_001": {
-                "name": "Crisis Responder",
-                "email": "crisis@example.com",
-                "role": "crisis_responder",
-                "parish_id": "parish_001",
-                "diocese_id": "diocese_001",
-                "password_hash": Authentication._hash_password("demo"),
-            },
-        }
+        conn.commit()
+        conn.close()
+    
+    @staticmethod
+    def _import_legacy_users(conn: sqlite3.Connection):
+        """
+        Copy accounts from the old auth.json into the users table
+        
+        Legacy SHA-256 hashes are kept as-is and upgraded to scrypt on the
+        next successful login. Rows whose id or email already exist are
+        skipped. The JSON file is renamed to auth.json.migrated once the
+        import is committed, so it is only read once.
+        """
+        legacy_file = Authentication.LEGACY_AUTH_FILE
+        if not legacy_file.exists():
+            return
         
-        if not Authentication.AUTH_FILE.exists():
-            with open(Authentication.AUTH_FILE, 'w') as f:
-                json.dump(demo_users, f, indent=2)
+        with open(legacy_file, 'r') as f:
+            legacy_users = json.load(f)
+        
+        with conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO users VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(user_id, data["name"], data["email"], data["role"],
+                  data.get("parish_id"), data.get("diocese_id"), data["password_hash"])
+                 for user_id, data in legacy_users.items()]
+            )
+        
+        legacy_file.replace(legacy_file.with_name(legacy_file.name + ".migrated"))
+    
+    @staticmethod
+    def _ensure_auth_db():
+        """Create AUTH_DB, or finish importing a leftover auth.json"""
+        if not Authentication.AUTH_DB.exists() or Authentication.LEGACY_AUTH_FILE.exists():
+            Authentication.init_auth_system()
+    
+    # scrypt cost parameters; n=2**14 keeps an interactive login around 50 ms
+    SCRYPT_N = 2 ** 14
+    SCRYPT_R = 8
+    SCRYPT_P = 1
     
     @staticmethod
     def _hash_password(password: str) -> str:
-        """Hash password with salt"""
+        """
+        Hash password with scrypt and a per-user random salt
+        
+        Stored as "scrypt$n$r$p$salt_b64$hash_b64" so the cost can be raised
+        later without breaking existing hashes.
+        """
+        n, r, p = Authentication.SCRYPT_N, Authentication.SCRYPT_R, Authentication.SCRYPT_P
+        salt = os.urandom(16)
+        digest = hashlib.scrypt(password.encode(), salt=salt, n=n, r=r, p=p, dklen=32)
+        return "$".join([
+            "scrypt", str(n), str(r), str(p),
+            base64.b64encode(salt).decode(),
+            base64.b64encode(digest).decode(),
+        ])
+    
+    @staticmethod
+    def _dummy_hash() -> str:
+        """
+        Fixed scrypt hash at the current cost, never matched by any password
+        
+        login verifies against it when there is no real scrypt hash to
+        check, so unknown emails take as long as known ones.
+        """
+        n, r, p = Authentication.SCRYPT_N, Authentication.SCRYPT_R, Authentication.SCRYPT_P
+        return "$".join([
+            "scrypt", str(n), str(r), str(p),
+            base64.b64encode(bytes(16)).decode(),
+            base64.b64encode(bytes(32)).decode(),
+        ])
+    
+    @staticmethod
+    def _legacy_hash_password(password: str) -> str:
+        """Pre-scrypt hash: single SHA-256 round with a global salt"""
         salt = "catholic_spiritual_os_salt"
         return hashlib.sha256(f"{salt}{password}".encode()).hexdigest()
     
+    @staticmethod
+    def _verify_password(password: str, stored_hash: str) -> bool:
+        """Check password against a scrypt or legacy SHA-256 stored hash"""
+        if not stored_hash.startswith("scrypt$"):
+            return hmac.compare_digest(
+                stored_hash, Authentication._legacy_hash_password(password)
+            )
+        
+        try:
+            _, n, r, p, salt_b64, digest_b64 = stored_hash.split("$")
+            expected = base64.b64decode(digest_b64)
+            digest = hashlib.scrypt(
+                password.encode(),
+                salt=base64.b64decode(salt_b64),
+                n=int(n), r=int(r), p=int(p),
+                dklen=len(expected)
+            )
+        except ValueError:
+            return False
+        return hmac.compare_digest(digest, expected)
+    
     @staticmethod
     def login(email: str, password: str) -> Optional[Tuple[str, dict]]:
         """
         Authenticate user
         Returns: (user_id, user_data) or None
         """
-        if not Authentication.AUTH_FILE.exists():
+        if Authentication.LEGACY_AUTH_FILE.exists():
+            Authentication._ensure_auth_db()
+        
+        if not Authentication.AUTH_DB.exists():
             return None
         
+        conn = sqlite3.connect(Authentication.AUTH_DB)
         try:
-            with open(Authentication.AUTH_FILE, 'r') as f:
-                users = json.load(f)
+            row = conn.execute(
+                "SELECT id, name, email, role, parish_id, diocese_id, password_hash "
+                "FROM users WHERE email = ?",
+                (email,)
+            ).fetchone()
             
-            password_hash = Authentication._hash_password(password)
+            if row is None:
+                # Same scrypt cost as a real account, so response time
+                # doesn't reveal which emails are registered
+                Authentication._verify_password(password, Authentication._dummy_hash())
+                return None
             
-            for user_id, user_data in users.items():
-                if user_data.get("email") == email and user_data.get("password_hash") == password_hash:
-                    return (user_id, user_data)
+            user_id, *fields = row
+            user_data = dict(zip(Authentication.USER_FIELDS, fields, strict=True))
             
-            return None
-        except Exception as e:
+            if not user_data["password_hash"].startswith("scrypt$"):
+                # Legacy SHA-256 checks are near-instant; pay the scrypt cost anyway
+                Authentication._verify_password(password, Authentication._dummy_hash())
+            
+            if not Authentication._verify_password(password, user_data["password_hash"]):
+                return None
+            
+            # Upgrade legacy SHA-256 hashes to scrypt on successful login
+            if not user_data["password_hash"].startswith("scrypt$"):
+                user_data["password_hash"] = Authentication._hash_password(password)
+                with conn:
+                    conn.execute(
+                        "UPDATE users SET password_hash = ? WHERE id = ?",
+                        (user_data["password_hash"], user_id)
+                    )
+            
+            return (user_id, user_data)
+        except sqlite3.Error as e:
             print(f"Auth error: {e}")
             return None
+        finally:
+            conn.close()
     
     @staticmethod
     def create_user(name: str, email: str, password: str, role: str, 
@@ -105,48 +252,36 @@ class Authentication:
         Create new user
         Returns: (success, message)
         """
-        if not Authentication.AUTH_FILE.exists():
-            Authentication.init_auth_system()
+        Authentication._ensure_auth_db()
         
+        conn = sqlite3.connect(Authentication.AUTH_DB)
         try:
-            with open(Authentication.AUTH_FILE, 'r') as f:
-                users = json.load(f)
+            # Random IDs: a count-based ID collides once any row is deleted
+            # or imported out of sequence
+            user_id = f"user_{uuid.uuid4().hex[:12]}"
             
-            # Check email exists
-            for user_data in users.values():
-                if user_data.get("email") == email:
-                    return (False, "Email already registered")
-            
-            # Generate user ID
-            user_id = f"user_{len(users) + 1:03d}"
-            
-            # Add new user
-            users[user_id] = {
-                "name": name,
-                "email": email,
-                "role": role,
-                "parish_id": parish_id,
-                "diocese_id": diocese_id,
-                "password_hash": Authentication._hash_password(password),
-            }
-            
-            with open(Authentication.AUTH_FILE, 'w') as f:
-                json.dump(users, f, indent=2)
+            # The UNIQUE constraint on email rejects duplicates via its index
+            with conn:
+                conn.execute(
+                    "INSERT INTO users VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (user_id, name, email, role, parish_id, diocese_id,
+                     Authentication._hash_password(password))
+                )
             
             return (True, f"User created: {user_id}")
-        except Exception as e:
+        except sqlite3.IntegrityError as e:
+            if "users.email" in str(e):
+                return (False, "Email already registered")
+            return (False, f"Error creating user: {e}")
+        except sqlite3.Error as e:
             return (False, f"Error creating user: {e}")
+        finally:
+            conn.close()
     
     @staticmethod
-    def list_demo_accounts() -> dict:
+    def list_demo_accounts() -> Mapping[str, Mapping[str, str]]:
         """List available demo accounts for testing"""
-        return {
-            "Individual": {"email": "john@example.com", "password": "demo"},
-            "Parish Coordinator": {"email": "sarah@example.com", "password": "demo"},
-            "Diocesan Leader": {"email": "bishop@example.com", "password": "demo"},
-            "Global Coordinator": {"email": "global@example.com", "password": "demo"},
-            "Crisis Responder": {"email": "crisis@example.com", "password": "demo"},
-        }
+        return DEMO_ACCOUNTS
 
 
 class PermissionManager:
@@ -155,15 +290,7 @@ class PermissionManager:
     @staticmethod
     def can_access_lens(user_role: str, lens: str) -> bool:
         """Check if user can access lens"""
-        access_matrix = {
-            "individual": ["personal", "parish"],
-            "parish_coordinator": ["personal", "parish", "diocese"],
-            "diocesan_leader": ["personal", "parish", "diocese", "global"],
-            "global_coordinator": ["personal", "parish", "diocese", "global"],
-            "crisis_responder": ["crisis", "personal", "parish"],
-        }
-        
-        return lens in access_matrix.get(user_role, [])
+        return lens in _LENS_ACCESS.get(user_role, frozenset())
     
     @staticmethod
     def can_see_personal_data(viewing_user_role: str, target_user_id: str, 
@@ -180,67 +307,129 @@ class PermissionManager:
             return False
     
     @staticmethod
-    def can_edit_parish_data(user_role: str, parish_id: str, user_parish_id: str) -> bool:
-        """Check if user can edit parish data"""
+    def can_edit_parish_data(user_role: str, parish_id: str, user_parish_id: str, *,
+                             parish_diocese_id: Optional[str],
+                             user_diocese_id: Optional[str]) -> bool:
+        """
+        Check if user can edit parish data
+        
+        Diocesan leaders may edit parishes in their own diocese only. This
+        used to allow them any parish, so the diocese ids are required
+        keywords: a three-argument call raises TypeError rather than
+        quietly denying. Deprecated for lists of parishes: use
+        filter_editable_parishes, which checks the whole list in one pass
+        and applies the same rules.
+        """
         if user_role == "parish_coordinator":
             # Only own parish
             return parish_id == user_parish_id
         elif user_role == "diocesan_leader":
-            # Can edit any parish in diocese
-            return True
+            # Any parish in their diocese
+            return parish_diocese_id is not None and parish_diocese_id == user_diocese_id
         else:
             return False
     
+    @staticmethod
+    def filter_editable_parishes(user_role: str, user_parish_id: str,
+                                 user_diocese_id: str, parishes: list) -> list:
+        """Return the parish dicts user can edit, resolving the role once"""
+        if user_role == "parish_coordinator":
+            # Only own parish
+            return [p for p in parishes if p.get("id") == user_parish_id]
+        elif user_role == "diocesan_leader":
+            # Any parish in their diocese
+            return [p for p in parishes
+                    if p.get("diocese_id") is not None and p.get("diocese_id") == user_diocese_id]
+        else:
+            return []
+    
     @staticmethod
     def can_activate_crisis(user_role: str) -> bool:
         """Check if user can activate crisis mode"""
-        return user_role in ["diocesan_leader", "crisis_responder"]
+        return user_role in _CRISIS_ROLES
     
     @staticmethod
     def can_view_campaign_details(user_role: str) -> bool:
         """Check if user can see detailed campaign statistics"""
-        return user_role in ["diocesan_leader", "global_coordinator"]
+        return user_role in _CAMPAIGN_DETAIL_ROLES
+    
+    @staticmethod
+    def build_parish_index(all_parishes: list) -> dict:
+        """
+        Group parish dicts by id and by diocese_id in one pass
+        
+        Build once per parish list and pass to get_accessible_parishes so
+        repeated permission checks skip the full scan.
+        """
+        by_id = defaultdict(list)
+        by_diocese = defaultdict(list)
+        for parish in all_parishes:
+            by_id[parish.get("id")].append(parish)
+            by_diocese[parish.get("diocese_id")].append(parish)
+        return {"by_id": dict(by_id), "by_diocese": dict(by_diocese)}
     
     @staticmethod
     def get_accessible_parishes(user_role: str, user_parish_id: str, 
-                               user_diocese_id: str, all_parishes: list) -> list:
-        """Get list of parishes user can see"""
-        if user_role == "individual":
-            # See their parish only
-            return [p for p in all_parishes if p.get("id") == user_parish_id]
+                               user_diocese_id: str, all_parishes: Iterable,
+                               index: Optional[dict] = None,
+                               as_iter: bool = False) -> Union[list, Iterator]:
+        """
+        Get parishes user can see, via build_parish_index if given
         
-        elif user_role == "parish_coordinator":
+        Checks the role once for the whole list. With as_iter=True a scan
+        is returned lazily, so very large rollups can be streamed.
+        """
+        if user_role in ("individual", "parish_coordinator"):
             # See their parish only
-            return [p for p in all_parishes if p.get("id") == user_parish_id]
+            if index is not None:
+                parishes = iter(index["by_id"].get(user_parish_id, []))
+            else:
+                parishes = (p for p in all_parishes if p.get("id") == user_parish_id)
         
         elif user_role == "diocesan_leader":
             # See all parishes in diocese (aggregated)
-            return [p for p in all_parishes if p.get("diocese_id") == user_diocese_id]
+            if index is not None:
+                parishes = iter(index["by_diocese"].get(user_diocese_id, []))
+            else:
+                parishes = (p for p in all_parishes if p.get("diocese_id") == user_diocese_id)
         
         elif user_role == "global_coordinator":
             # See all parishes
+            if as_iter:
+                return iter(all_parishes)
             return all_parishes
         
         else:
-            return []
+            parishes = iter(())
+        
+        return parishes if as_iter else list(parishes)
     
     @staticmethod
     def get_accessible_dioceses(user_role: str, user_diocese_id: str, 
-                               all_dioceses: list) -> list:
-        """Get list of dioceses user can see"""
+                               all_dioceses: Iterable,
+                               as_iter: bool = False) -> Union[list, Iterator]:
+        """
+        Get dioceses user can see
+        
+        Checks the role once for the whole list; as_iter=True streams it.
+        """
         if user_role in ["individual", "parish_coordinator"]:
-            return []  # Don't see diocese level directly
+            dioceses = iter(())  # Don't see diocese level directly
         
         elif user_role == "diocesan_leader":
             # See only their diocese
-            return [d for d in all_dioceses if d.get("id") == user_diocese_id]
+            dioceses = (d for d in all_dioceses if d.get("id") == user_diocese_id)
         
         elif user_role in ["global_coordinator", "crisis_responder"]:
             # See all dioceses
+            if as_iter:
+                return iter(all_dioceses)
             return all_dioceses
         
         else:
-            return []
+            dioceses = iter(())
+        
+        return dioceses if as_iter else list(dioceses)
 
 
 def show_login_screen() -> Optional[Tuple[str, dict]]:
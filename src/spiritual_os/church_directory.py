@@ -15,10 +15,20 @@ Data sources:
 Coverage goal: 200+ countries, 100,000+ parishes
 """
 
-from dataclasses import dataclass
-from typing import List, Optional, Dict
+from bisect import bisect_right
+from collections import defaultdict
+from dataclasses import dataclass, field
+from functools import cache, lru_cache
+from typing import FrozenSet, Iterator, List, Optional, Dict, Sequence, Tuple
 from enum import Enum
 from datetime import time
+from itertools import accumulate, chain
+from pathlib import Path
+from types import MappingProxyType
+import json
+import math
+
+import numpy as np
 
 
 class MassLanguage(Enum):
@@ -61,7 +71,7 @@ class WelcomeLevel(Enum):
     UNKNOWN = "Unknown"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MassSchedule:
     """Mass times for a parish"""
     sunday_times: List[str]  # ["7:00 AM", "9:00 AM", "11:00 AM", "5:00 PM"]
@@ -72,7 +82,7 @@ class MassSchedule:
     adoration_times: Optional[str]  # "First Friday 7:00 PM - Saturday 7:00 AM"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ChurchContact:
     """Contact information for a church"""
     phone: Optional[str]
@@ -82,7 +92,7 @@ class ChurchContact:
     whatsapp: Optional[str]  # Important for Africa/Asia
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Church:
     """
     Individual Catholic church/parish
@@ -114,12 +124,12 @@ class Church:
     
     # Mass & Services
     mass_schedule: MassSchedule
-    mass_languages: List[MassLanguage]
+    mass_languages: Tuple[MassLanguage, ...]
     
     # Community
     registered_families: Optional[int]
     average_sunday_attendance: Optional[int]
-    ethnic_communities: List[str]  # ["Filipino", "Nigerian", "Mexican"]
+    ethnic_communities: Tuple[str, ...]  # ("Filipino", "Nigerian", "Mexican")
     special_ministries: List[str]  # ["Young adults", "Grief support", "RCIA"]
     
     # Welcome & Accessibility
@@ -139,124 +149,311 @@ class Church:
     notes: Optional[str]
     last_updated: str
     verified: bool  # Has parish confirmed this info?
+    
+    # Derived: O(1) language membership instead of scanning mass_languages
+    _languages_set: FrozenSet[MassLanguage] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, "_languages_set", frozenset(self.mass_languages))
+    
+    def offers_language(self, language: MassLanguage) -> bool:
+        """Whether Mass is celebrated in this language"""
+        return language in self._languages_set
+
+
+EARTH_RADIUS_KM = 6371.0088
+COORD_SCALE = 10_000_000  # int32 fixed-point degrees
+COORD_MAX_ERROR = 1.1e-7  # ~1 cm; checked when the store is built with debug=True
+KM_PER_DEGREE_LAT = EARTH_RADIUS_KM * np.pi / 180
+
+# Small integer codes per enum member, so column filters compare bytes, not Enums
+TYPE_CODE = MappingProxyType({t: i for i, t in enumerate(ChurchType)})
+WELCOME_CODE = MappingProxyType({w: i for i, w in enumerate(WelcomeLevel)})
+LANGUAGE_BIT = MappingProxyType({lang: 1 << i for i, lang in enumerate(MassLanguage)})
+
+
+class ChurchDirectorySoA:
+    """
+    Column store over a list of churches for bulk queries
+    
+    Coordinates, countries, enum fields and languages live in parallel NumPy
+    arrays so radius and attribute filters run as vectorized scans instead of a
+    Python loop over Church objects. Church stays the record type for
+    detail views; queries return the matching Church objects.
+    """
+    
+    def __init__(self, churches: Sequence[Church], debug: bool = False):
+        self.churches = tuple(churches)
+        n = len(self.churches)
+        
+        # Object column so result rows are gathered by fancy indexing, not a Python loop
+        self._church_arr = np.empty(n, dtype=object)
+        self._church_arr[:] = self.churches
+        
+        lat = np.fromiter((c.latitude for c in self.churches), dtype=np.float64, count=n)
+        lon = np.fromiter((c.longitude for c in self.churches), dtype=np.float64, count=n)
+        
+        # Fixed-point degrees × 1e7 (OpenStreetMap's encoding): half the bytes per scan
+        self.lat_i32 = np.round(lat * COORD_SCALE).astype(np.int32)
+        self.lon_i32 = np.round(lon * COORD_SCALE).astype(np.int32)
+        
+        if debug:
+            error = max(
+                np.abs(self.lat_i32 / COORD_SCALE - lat).max(initial=0.0),
+                np.abs(self.lon_i32 / COORD_SCALE - lon).max(initial=0.0),
+            )
+            if error >= COORD_MAX_ERROR:
+                raise ValueError(f"Coordinate quantization error {error:.2e}° exceeds {COORD_MAX_ERROR:.1e}°")
+        
+        # Radians and cos(lat) depend only on the directory, so haversine
+        # reads them instead of recomputing them for every query
+        self.lat_rad = self.lat_i32 * (np.pi / 180 / COORD_SCALE)
+        self.lon_rad = self.lon_i32 * (np.pi / 180 / COORD_SCALE)
+        self.cos_lat = np.cos(self.lat_rad)
+        
+        # Latitude-sorted order: a radius query binary-searches its latitude
+        # band and only runs haversine on the rows inside it
+        self._lat_order = np.argsort(self.lat_i32, kind="stable")
+        self._lat_sorted = self.lat_i32[self._lat_order]
+        
+        # Countries as small integer codes into a sorted category table
+        countries, codes = np.unique([c.country.lower() for c in self.churches], return_inverse=True)
+        self.countries = tuple(countries.tolist())
+        self._country_code = {name: i for i, name in enumerate(self.countries)}
+        self.country = codes.astype(np.int32)
+        
+        self.type_i8 = np.fromiter((TYPE_CODE[c.type] for c in self.churches), dtype=np.int8, count=n)
+        self.welcome_i8 = np.fromiter(
+            (WELCOME_CODE[c.welcome_level] for c in self.churches), dtype=np.int8, count=n
+        )
+        
+        # Multi-valued languages as one bit per MassLanguage (15 members fit a uint16)
+        self.lang_mask = np.fromiter(
+            (sum(LANGUAGE_BIT[lang] for lang in c._languages_set) for c in self.churches),
+            dtype=np.uint16,
+            count=n,
+        )
+    
+    def __len__(self) -> int:
+        return len(self.churches)
+    
+    def _select(self, mask: np.ndarray) -> List[Church]:
+        return self._church_arr[mask].tolist()
+    
+    def _haversine_term(self, lat: float, lon: float, rows) -> np.ndarray:
+        """
+        Haversine h = sin²(dlat/2) + cos(lat1)·cos(lat2)·sin²(dlon/2) per row
+        
+        Computed in place over two work buffers instead of one temporary
+        array per ufunc.
+        """
+        lat1, lon1 = math.radians(lat), math.radians(lon)
+        
+        # np.subtract/np.multiply allocate the buffers, so the cached
+        # columns are never modified even when rows is a full slice
+        half_dlon = np.subtract(self.lon_rad[rows], lon1)
+        half_dlon *= 0.5
+        np.sin(half_dlon, out=half_dlon)
+        half_dlon *= half_dlon
+        
+        h = np.multiply(self.cos_lat[rows], math.cos(lat1))
+        h *= half_dlon
+        
+        half_dlat = np.subtract(self.lat_rad[rows], lat1)
+        half_dlat *= 0.5
+        np.sin(half_dlat, out=half_dlat)
+        half_dlat *= half_dlat
+        h += half_dlat
+        return h
+    
+    def _haversine_km(self, lat: float, lon: float, rows) -> np.ndarray:
+        h = self._haversine_term(lat, lon, rows)
+        np.clip(h, 0.0, 1.0, out=h)
+        np.sqrt(h, out=h)
+        np.arcsin(h, out=h)
+        h *= 2 * EARTH_RADIUS_KM
+        return h
+    
+    def distances_km(self, lat: float, lon: float) -> np.ndarray:
+        """Great-circle distance (haversine) from a point to every church"""
+        return self._haversine_km(lat, lon, slice(None))
+    
+    def _lat_band(self, lat: float, km: float) -> np.ndarray:
+        """Row indices, in directory order, whose latitude is within km of lat"""
+        dlat = km / KM_PER_DEGREE_LAT
+        lo = np.searchsorted(self._lat_sorted, np.floor((lat - dlat) * COORD_SCALE), side="left")
+        hi = np.searchsorted(self._lat_sorted, np.ceil((lat + dlat) * COORD_SCALE), side="right")
+        return np.sort(self._lat_order[lo:hi])
+    
+    @staticmethod
+    def _max_dlon(lat: float, km: float) -> Optional[float]:
+        """
+        Widest longitude offset (degrees) of any point within km of lat
+        
+        None when the circle reaches a pole, where every longitude qualifies.
+        """
+        dlat = km / KM_PER_DEGREE_LAT
+        if abs(lat) + dlat >= 90:
+            return None
+        ratio = np.sin(np.radians(dlat)) / np.cos(np.radians(lat))
+        return float(np.degrees(np.arcsin(min(ratio, 1.0))))
+    
+    def _bbox_rows(self, lat: float, lon: float, km: float) -> np.ndarray:
+        """Latitude band narrowed to the longitude span; cheap compares only"""
+        rows = self._lat_band(lat, km)
+        dlon = self._max_dlon(lat, km)
+        if dlon is None or rows.size == 0:
+            return rows
+        
+        # Compare in fixed-point integers: no per-row float conversion. int64
+        # because a full-circle difference (3.6e9) overflows int32. Longitude
+        # distance wraps at the antimeridian.
+        diff = np.abs(self.lon_i32[rows].astype(np.int64) - round(lon * COORD_SCALE))
+        diff = np.minimum(diff, 360 * COORD_SCALE - diff)
+        return rows[diff <= int(np.ceil(dlon * COORD_SCALE)) + 1]
+    
+    def nearby(self, lat: float, lon: float, km: float) -> List[Church]:
+        """Churches within km of a point"""
+        # Only rows inside the bounding box pay for the trig in haversine, and
+        # d <= km is tested as h <= sin²(km / 2R) so no row needs sqrt/arcsin
+        rows = self._bbox_rows(lat, lon, km)
+        angle = km / EARTH_RADIUS_KM
+        if angle >= np.pi:
+            return self._church_arr[rows].tolist()
+        limit = np.sin(angle / 2) ** 2
+        return self._church_arr[rows[self._haversine_term(lat, lon, rows) <= limit]].tolist()
+    
+    def language_mask(self, language: MassLanguage) -> np.ndarray:
+        """Boolean mask of churches offering Mass in a language"""
+        return (self.lang_mask & LANGUAGE_BIT[language]) != 0
+    
+    def with_language(self, language: MassLanguage) -> List[Church]:
+        """Churches offering Mass in a language"""
+        return self._select(self.language_mask(language))
+    
+    def in_country(self, country: str) -> List[Church]:
+        """Churches in a country (case-insensitive)"""
+        code = self._country_code.get(country.lower())
+        if code is None:
+            return []
+        return self._select(self.country == code)
+    
+    def filter(
+        self,
+        church_type: Optional[ChurchType] = None,
+        language: Optional[MassLanguage] = None,
+        welcome_level: Optional[WelcomeLevel] = None,
+    ) -> List[Church]:
+        """Churches matching every given criterion"""
+        mask = np.ones(len(self.churches), dtype=bool)
+        if church_type is not None:
+            mask &= self.type_i8 == TYPE_CODE[church_type]
+        if language is not None:
+            mask &= self.language_mask(language)
+        if welcome_level is not None:
+            mask &= self.welcome_i8 == WELCOME_CODE[welcome_level]
+        return self._select(mask)
 
 
 # ============================================================================
-# DEMO DATA - GLOBAL COVERAGE
+# DIRECTORY DATA - ONE JSON SHARD PER COUNTRY, LOADED ON DEMAND
 # ============================================================================
 
-# Example: Bhutan (7 parishes, all under Darjeeling Diocese, India)
-BHUTAN_CHURCHES = [
-    Church(
-        id="church_bhutan_001",
-        name="St. Mary's Church",
-        type=ChurchType.PARISH,
-        country="Bhutan",
-        region="Thimphu District",
-        city="Thimphu",
-        address="Chang Lam, near Clock Tower Square",
-        latitude=27.4712,
-        longitude=89.6339,
-        diocese="Darjeeling",
-        archdiocese=None,
-        bishop="Bishop Stephen Lepcha",
-        pastor="Fr. Benedict D'Souza",
-        associate_pastors=[],
-        deacons=[],
-        mass_schedule=MassSchedule(
-            sunday_times=["10:00 AM"],
-            weekday_times=[],
-            saturday_vigil=None,
-            holy_days="As announced",
-            confession_times=["By appointment"],
-            adoration_times=None
-        ),
-        mass_languages=[MassLanguage.ENGLISH, MassLanguage.HINDI],
-        registered_families=30,
-        average_sunday_attendance=100,
-        ethnic_communities=["Indian expats", "Bhutanese converts", "Filipino workers"],
-        special_ministries=["Catechism for children"],
-        welcome_level=WelcomeLevel.VERY_WELCOMING,
-        lgbtq_welcoming=None,
-        wheelchair_accessible=False,
-        parking_available=False,
-        nursery_available=False,
-        contact=ChurchContact(
-            phone="+975-2-322-743",
-            email="stmarysthimphu@gmail.com",
-            website=None,
-            facebook=None,
-            whatsapp="+975-77-123456"
-        ),
-        established_year=1985,
-        architectural_style="Simple modern",
-        patron_saint="Our Lady of Perpetual Help",
-        notes="Small but vibrant community. Visitors always welcome. Contact priest in advance if possible.",
-        last_updated="2026-02-13",
-        verified=False
-    )
-]
-
-# Example: Kenya - Consolata Shrine (from earlier context)
-KENYA_CHURCHES = [
-    Church(
-        id="church_kenya_001",
-        name="Consolata Shrine",
-        type=ChurchType.SHRINE,
-        country="Kenya",
-        region="Nairobi County",
-        city="Nairobi",
-        address="Westlands, along Waiyaki Way",
-        latitude=-1.2667,
-        longitude=36.8000,
-        diocese="Archdiocese of Nairobi",
-        archdiocese="Nairobi",
-        bishop="Archbishop Philip Anyolo",
-        pastor="Fr. James Odhiambo",
-        associate_pastors=["Fr. Peter Kamau", "Fr. David Mwangi"],
-        deacons=["Deacon John Karanja"],
-        mass_schedule=MassSchedule(
-            sunday_times=["6:30 AM", "8:00 AM", "10:00 AM", "12:00 PM", "5:30 PM"],
-            weekday_times=["6:30 AM", "12:10 PM", "5:30 PM"],
-            saturday_vigil="5:30 PM",
-            holy_days="As announced",
-            confession_times=["Saturday 4:00-5:00 PM", "Daily after Mass"],
-            adoration_times="24/7 Perpetual Adoration Chapel"
-        ),
-        mass_languages=[MassLanguage.ENGLISH, MassLanguage.SWAHILI],
-        registered_families=2500,
-        average_sunday_attendance=3500,
-        ethnic_communities=["Kikuyu", "Luo", "Luhya", "International"],
-        special_ministries=[
-            "Small Christian Communities (45 SCCs)",
-            "Youth Ministry",
-            "Consolata Missionaries",
-            "Shrine bookstore",
-            "Counseling center"
-        ],
-        welcome_level=WelcomeLevel.VERY_WELCOMING,
-        lgbtq_welcoming=None,
-        wheelchair_accessible=True,
-        parking_available=True,
-        nursery_available=True,
-        contact=ChurchContact(
-            phone="+254-20-444-7479",
-            email="info@consolatashrine.org",
-            website="https://consolatashrine.org",
-            facebook="ConsolataShrineNairobi",
-            whatsapp="+254-722-123456"
-        ),
-        established_year=1955,
-        architectural_style="Modernist with African motifs",
-        patron_saint="Our Lady Consolata",
-        notes="Major pilgrimage site in East Africa. Very active SCCs. Bookstore with Catholic literature.",
-        last_updated="2026-02-13",
-        verified=True
-    )
-]
-
-# Demo church database
-DEMO_CHURCHES = BHUTAN_CHURCHES + KENYA_CHURCHES
+# data/churches/<country>.json, e.g. bhutan.json (7 parishes under Darjeeling
+# Diocese, India) and kenya.json (Consolata Shrine, Nairobi)
+CHURCH_DATA_DIR = Path(__file__).resolve().parents[2] / "data" / "churches"
+
+# Module attributes kept for callers that import the old eager lists
+_COUNTRY_LISTS = MappingProxyType({
+    "BHUTAN_CHURCHES": "bhutan",
+    "KENYA_CHURCHES": "kenya",
+})
+
+
+def _church_from_row(row: dict) -> Church:
+    """Rebuild a Church (and its nested records/enums) from a JSON row"""
+    return Church(**{
+        **row,
+        "type": ChurchType(row["type"]),
+        "mass_schedule": MassSchedule(**row["mass_schedule"]),
+        "mass_languages": tuple(MassLanguage(lang) for lang in row["mass_languages"]),
+        "ethnic_communities": tuple(row["ethnic_communities"]),
+        "welcome_level": WelcomeLevel(row["welcome_level"]),
+        "contact": ChurchContact(**row["contact"]),
+    })
+
+
+@lru_cache(maxsize=1)
+def available_countries() -> Tuple[str, ...]:
+    """Shard keys (lowercased country names) present in CHURCH_DATA_DIR"""
+    return tuple(sorted(path.stem for path in CHURCH_DATA_DIR.glob("*.json")))
+
+
+def _country_key(country: str) -> str:
+    return country.strip().lower().replace(" ", "_")
+
+
+@cache
+def _load_country(key: str) -> Tuple[Church, ...]:
+    """Parse one country's shard on first use; unknown keys load nothing"""
+    # Only keys found on disk are opened, so user input never forms a path
+    if key not in available_countries():
+        return ()
+    with open(CHURCH_DATA_DIR / f"{key}.json", encoding="utf-8") as f:
+        return tuple(_church_from_row(row) for row in json.load(f))
+
+
+@cache
+def _city_index(key: str) -> Dict[str, List[Church]]:
+    """One country's churches grouped by lowercased city"""
+    by_city = defaultdict(list)
+    for church in _load_country(key):
+        by_city[church.city.lower()].append(church)
+    return dict(by_city)
+
+
+def iter_all_churches() -> Iterator[Church]:
+    """Stream every shard in turn without building a combined list"""
+    return chain.from_iterable(_load_country(key) for key in available_countries())
+
+
+def _all_churches() -> Tuple[Church, ...]:
+    """Every shard, loaded (and cached) one country at a time"""
+    return tuple(iter_all_churches())
+
+
+class _GlobalIndex:
+    """Structures for directory-wide searches, built once on first such search"""
+    
+    def __init__(self, churches: Sequence[Church]):
+        self.churches = tuple(churches)
+        self.soa = ChurchDirectorySoA(self.churches)
+        
+        by_language = defaultdict(list)
+        for church in self.churches:
+            for language in church._languages_set:
+                by_language[language].append(church)
+        self.by_language = dict(by_language)
+        
+        # Lowercased names joined into one newline-separated haystack, so a name
+        # search is a C-level str.find pass instead of lowercasing every name
+        lower_names = [c.name.lower() for c in self.churches]
+        self.name_haystack = "\n".join(lower_names)
+        self.name_starts = list(accumulate((len(n) + 1 for n in lower_names), initial=0))[:-1]
+
+
+@lru_cache(maxsize=1)
+def _global_index() -> _GlobalIndex:
+    return _GlobalIndex(_all_churches())
+
+
+def __getattr__(name: str):
+    """Materialize DEMO_CHURCHES / <COUNTRY>_CHURCHES only when imported"""
+    if name == "DEMO_CHURCHES":
+        return list(_all_churches())
+    if name in _COUNTRY_LISTS:
+        return list(_load_country(_COUNTRY_LISTS[name]))
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class ChurchDirectory:
@@ -266,37 +463,45 @@ class ChurchDirectory:
     
     @staticmethod
     def search_by_location(country: str, city: Optional[str] = None) -> List[Church]:
-        """Find churches by location"""
-        results = [c for c in DEMO_CHURCHES if c.country.lower() == country.lower()]
-        
+        """Find churches by location; loads only that country's shard"""
+        key = _country_key(country)
         if city:
-            results = [c for c in results if c.city.lower() == city.lower()]
-        
-        return results
+            return list(_city_index(key).get(city.strip().lower(), ()))
+        return list(_load_country(key))
     
     @staticmethod
     def search_by_coordinates(lat: float, lon: float, radius_km: float = 50) -> List[Church]:
-        """Find churches near coordinates (simplified)"""
-        # Simplified distance calculation (would use proper geospatial in production)
-        results = []
-        for church in DEMO_CHURCHES:
-            # Rough approximation: 1 degree ≈ 111 km
-            lat_diff = abs(church.latitude - lat)
-            lon_diff = abs(church.longitude - lon)
-            distance = ((lat_diff ** 2) + (lon_diff ** 2)) ** 0.5 * 111
-            
-            if distance <= radius_km:
-                results.append(church)
-        
-        return results
+        """Find churches within radius_km of coordinates (great-circle distance)"""
+        return _global_index().soa.nearby(lat, lon, radius_km)
+    
+    @staticmethod
+    def iter_by_language(language: MassLanguage) -> Iterator[Church]:
+        """Lazily yield churches offering Mass in a language, for any()/all() checks"""
+        return iter(_global_index().by_language.get(language, ()))
     
     @staticmethod
     def search_by_language(language: MassLanguage) -> List[Church]:
         """Find churches offering Mass in specific language"""
-        return [c for c in DEMO_CHURCHES if language in c.mass_languages]
+        return list(ChurchDirectory.iter_by_language(language))
     
     @staticmethod
     def search_by_name(query: str) -> List[Church]:
         """Search churches by name"""
+        index = _global_index()
         query_lower = query.lower()
-        return [c for c in DEMO_CHURCHES if query_lower in c.name.lower()]
+        if not query_lower:
+            return list(index.churches)
+        if "\n" in query_lower:
+            return []
+        
+        haystack, starts = index.name_haystack, index.name_starts
+        results = []
+        pos = haystack.find(query_lower)
+        while pos != -1:
+            row = bisect_right(starts, pos) - 1
+            results.append(index.churches[row])
+            # Resume at the next name so each church is reported once
+            if row + 1 == len(starts):
+                break
+            pos = haystack.find(query_lower, starts[row + 1])
+        return results
@@ -20,6 +20,8 @@ ADAPTATION:
 """
 
 from dataclasses import dataclass
+from functools import cached_property
+from types import MappingProxyType
 from typing import Literal, Optional, List
 from enum import Enum
 import streamlit as st
@@ -58,12 +60,46 @@ class LiteracyLevel(Enum):
     BASIC = "basic"      # Struggles with text, needs audio/visual
 
 
-@dataclass
+# Session-state keys detect() reads; the context is rebuilt only when one changes
+_DETECTION_INPUTS = ("connection_speed", "device_type", "country", "city", "language", "data_saver")
+
+# UI modes that load images / offer audio alternatives
+_IMAGE_MODES = frozenset({UIMode.FULL_FEATURED, UIMode.SIMPLIFIED})
+_AUDIO_MODES = frozenset({UIMode.AUDIO_VISUAL, UIMode.TEXT_ONLY})
+
+# Session preference string -> ConnectionSpeed ("auto" and unknown fall back)
+_CONNECTION_SPEEDS = MappingProxyType({speed.value: speed for speed in ConnectionSpeed})
+
+_DEVICE_MAP = MappingProxyType({
+    "smartphone": DeviceType.SMARTPHONE,
+    "basic_phone": DeviceType.BASIC_PHONE,
+    "tablet": DeviceType.TABLET,
+    "desktop": DeviceType.DESKTOP,
+})
+
+# Per-speed lookups: estimated bandwidth (Mbps) and content budget (KB)
+_BANDWIDTH = MappingProxyType({
+    ConnectionSpeed.FAST_4G: 25.0,
+    ConnectionSpeed.MEDIUM_3G: 3.0,
+    ConnectionSpeed.SLOW_2G: 0.3,
+    ConnectionSpeed.OFFLINE: 0.0,
+})
+
+_MAX_KB = MappingProxyType({
+    ConnectionSpeed.FAST_4G: 5000,   # 5 MB
+    ConnectionSpeed.MEDIUM_3G: 500,  # 500 KB
+    ConnectionSpeed.SLOW_2G: 100,    # 100 KB
+    ConnectionSpeed.OFFLINE: 50,     # 50 KB (offline/minimal)
+})
+
+
+@dataclass(frozen=True)
 class UserContext:
     """
     User's current context
     
-    Detected automatically and used to adapt UI
+    Detected automatically and used to adapt UI. Frozen, since UI mode and
+    the other derived settings are pure functions of these fields.
     """
     
     # Network
@@ -87,7 +123,7 @@ class UserContext:
     
     # User preferences
     language: str = "en"
-    languages: List[str] = None
+    languages: Optional[List[str]] = None
     
     # Inferred characteristics
     literacy_level: LiteracyLevel = LiteracyLevel.HIGH
@@ -95,9 +131,10 @@ class UserContext:
     
     def __post_init__(self):
         if self.languages is None:
-            self.languages = [self.language]
+            object.__setattr__(self, "languages", [self.language])
     
-    @property
+    # Derived settings are computed once per context; the fields are frozen
+    @cached_property
     def ui_mode(self) -> UIMode:
         """Determine optimal UI mode based on context"""
         
@@ -124,27 +161,20 @@ class UserContext:
         # Default: Full featured
         return UIMode.FULL_FEATURED
     
-    @property
+    @cached_property
     def should_load_images(self) -> bool:
         """Should we load images?"""
-        return self.ui_mode in [UIMode.FULL_FEATURED, UIMode.SIMPLIFIED]
+        return self.ui_mode in _IMAGE_MODES
     
-    @property
+    @cached_property
     def should_use_audio(self) -> bool:
         """Should we provide audio alternatives?"""
-        return self.ui_mode in [UIMode.AUDIO_VISUAL, UIMode.TEXT_ONLY]
+        return self.ui_mode in _AUDIO_MODES
     
-    @property
+    @cached_property
     def max_content_size_kb(self) -> int:
         """Maximum content size to load (KB)"""
-        if self.connection_speed == ConnectionSpeed.FAST_4G:
-            return 5000  # 5 MB
-        elif self.connection_speed == ConnectionSpeed.MEDIUM_3G:
-            return 500   # 500 KB
-        elif self.connection_speed == ConnectionSpeed.SLOW_2G:
-            return 100   # 100 KB
-        else:
-            return 50    # 50 KB (offline/minimal)
+        return _MAX_KB[self.connection_speed]
 
 
 class ContextDetector:
@@ -165,6 +195,11 @@ class ContextDetector:
         # Get Streamlit session info
         session_state = st.session_state
         
+        # Reruns with unchanged inputs reuse the context stored last time
+        key = tuple(session_state.get(name) for name in _DETECTION_INPUTS)
+        if session_state.get("_ctx_key") == key and "user_context" in session_state:
+            return session_state["user_context"]
+        
         # Detect connection speed (simplified)
         connection_speed = ContextDetector._detect_connection_speed()
         
@@ -200,7 +235,8 @@ class ContextDetector:
         )
         
         # Store in session for reuse
-        st.session_state["user_context"] = context
+        session_state["user_context"] = context
+        session_state["_ctx_key"] = key
         
         return context
     
@@ -215,17 +251,8 @@ class ContextDetector:
         # For now, check if user set preference
         speed_pref = st.session_state.get("connection_speed", "auto")
         
-        if speed_pref == "4g":
-            return ConnectionSpeed.FAST_4G
-        elif speed_pref == "3g":
-            return ConnectionSpeed.MEDIUM_3G
-        elif speed_pref == "2g":
-            return ConnectionSpeed.SLOW_2G
-        elif speed_pref == "offline":
-            return ConnectionSpeed.OFFLINE
-        else:
-            # Auto-detect (default to fast for demo)
-            return ConnectionSpeed.FAST_4G
+        # Auto-detect (default to fast for demo)
+        return _CONNECTION_SPEEDS.get(speed_pref, ConnectionSpeed.FAST_4G)
     
     @staticmethod
     def _detect_device_type() -> DeviceType:
@@ -234,14 +261,7 @@ class ContextDetector:
         # For now, check session or default
         device_pref = st.session_state.get("device_type", "smartphone")
         
-        device_map = {
-            "smartphone": DeviceType.SMARTPHONE,
-            "basic_phone": DeviceType.BASIC_PHONE,
-            "tablet": DeviceType.TABLET,
-            "desktop": DeviceType.DESKTOP,
-        }
-        
-        return device_map.get(device_pref, DeviceType.SMARTPHONE)
+        return _DEVICE_MAP.get(device_pref, DeviceType.SMARTPHONE)
     
     @staticmethod
     def _detect_location() -> tuple[Optional[str], Optional[str]]:
@@ -260,13 +280,7 @@ class ContextDetector:
     @staticmethod
     def _estimate_bandwidth(speed: ConnectionSpeed) -> float:
         """Estimate bandwidth in Mbps"""
-        bandwidth_map = {
-            ConnectionSpeed.FAST_4G: 25.0,
-            ConnectionSpeed.MEDIUM_3G: 3.0,
-            ConnectionSpeed.SLOW_2G: 0.3,
-            ConnectionSpeed.OFFLINE: 0.0,
-        }
-        return bandwidth_map[speed]
+        return _BANDWIDTH[speed]
     
     @staticmethod
     def _is_data_conscious() -> bool:
@@ -324,16 +338,19 @@ class AdaptiveUI:
     
     def show_context_banner(self):
         """Show context-aware banner"""
-        mode = self.context.ui_mode
-        
-        if mode == UIMode.TEXT_ONLY:
-            st.warning("📱 **Data Saver Mode Active** - Images hidden to save bandwidth")
-        elif mode == UIMode.OFFLINE_FIRST:
-            st.info("✈️ **Offline Mode** - Using cached content")
-        elif mode == UIMode.SMS_BRIDGE:
-            st.success("📲 **SMS Mode** - Send commands via SMS to 40404")
-        elif mode == UIMode.AUDIO_VISUAL:
-            st.info("🔊 **Audio Mode** - Voice assistance available")
+        banner = _BANNERS.get(self.context.ui_mode)
+        if banner:
+            show, message = banner
+            show(message)
+
+
+# Banner per UI mode: (streamlit element, message); other modes show none
+_BANNERS = MappingProxyType({
+    UIMode.TEXT_ONLY: (st.warning, "📱 **Data Saver Mode Active** - Images hidden to save bandwidth"),
+    UIMode.OFFLINE_FIRST: (st.info, "✈️ **Offline Mode** - Using cached content"),
+    UIMode.SMS_BRIDGE: (st.success, "📲 **SMS Mode** - Send commands via SMS to 40404"),
+    UIMode.AUDIO_VISUAL: (st.info, "🔊 **Audio Mode** - Voice assistance available"),
+})
 
 
 # DEMO CONTEXTS
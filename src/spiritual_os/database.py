@@ -5,12 +5,179 @@ Handles all data persistence for nested architecture
 
 import sqlite3
 import json
-from typing import List, Optional, Dict, Any
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import Iterable, Iterator, List, Optional, Dict, Any
 from pathlib import Path
 from datetime import datetime
 
 DB_PATH = Path(".data/spiritual_os.db")
 
+# Applied once per connection: WAL so readers don't block the writer,
+# NORMAL sync (safe under WAL), 64 MB page cache and 256 MB mmap
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+)
+
+# Hot-path statements as module constants: sqlite3 caches prepared
+# statements per connection keyed by SQL text, so reusing the identical
+# string lets every call after the first skip parsing and planning
+_SAVE_USER_SQL = "INSERT OR REPLACE INTO users VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+_GET_USER_SQL = "SELECT * FROM users WHERE id = ?"
+_GET_PARISH_USERS_SQL = "SELECT * FROM users WHERE parish_id = ?"
+_SAVE_PARISH_SQL = "INSERT OR REPLACE INTO parishes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+_GET_PARISH_SQL = "SELECT * FROM parishes WHERE id = ?"
+_DELETE_EXPIRED_CRISES_SQL = "DELETE FROM crisis_events WHERE auto_delete_date < ?"
+
+# Child tables mirroring the hot fields of the journal/event JSON blobs,
+# rewritten alongside the parent row so SQL can count without decoding
+_DELETE_JOURNAL_ENTRIES_SQL = "DELETE FROM user_journal_entries WHERE user_id = ?"
+_INSERT_JOURNAL_ENTRY_SQL = "INSERT INTO user_journal_entries VALUES (?, ?, ?, ?)"
+_DELETE_PARISH_EVENTS_SQL = "DELETE FROM parish_events WHERE parish_id = ?"
+_INSERT_PARISH_EVENT_SQL = "INSERT INTO parish_events VALUES (?, ?, ?, ?, ?)"
+
+# JSON columns: one compact encoder built once (json.dumps with custom
+# separators would construct a new JSONEncoder on every call)
+_dumps = json.JSONEncoder(separators=(",", ":")).encode
+
+# Rows decoded per fetchmany() when reading a whole parish
+_FETCH_BATCH = 1000
+
+
+def _user_row(user: 'User', now: str) -> tuple:
+    """users row for _SAVE_USER_SQL"""
+    return (
+        user.id,
+        user.name,
+        user.email,
+        user.role.value,
+        user.parish_id,
+        user.diocese_id,
+        user.opt_in_to_parish_aggregates,
+        user.opt_in_to_diocese_aggregates,
+        user.opt_in_to_global_aggregates,
+        user.privacy_level,
+        _dumps(user.rule_of_life),
+        _dumps(user.journal_entries),
+        _dumps(user.sacrament_milestones),
+        user.created_at or now,
+        now,
+    )
+
+
+def _sync_journal_entries(conn: sqlite3.Connection, users: List['User']):
+    """Replace the user_journal_entries rows of each user"""
+    conn.executemany(_DELETE_JOURNAL_ENTRIES_SQL, [(user.id,) for user in users])
+    conn.executemany(_INSERT_JOURNAL_ENTRY_SQL, [
+        (user.id, seq, entry.get("date"), entry.get("template_type"))
+        for user in users
+        for seq, entry in enumerate(user.journal_entries)
+    ])
+
+
+def _parish_row(parish: 'Parish', now: str) -> tuple:
+    """parishes row for _SAVE_PARISH_SQL"""
+    return (
+        parish.id,
+        parish.name,
+        parish.diocese_id,
+        parish.coordinator_id,
+        parish.address,
+        parish.phone,
+        parish.email,
+        parish.bulletin_text,
+        _dumps(parish.events),
+        _dumps(parish.volunteer_signups),
+        parish.aggregated_members_count,
+        parish.aggregated_formation_participants,
+        parish.aggregated_avg_practice_minutes,
+        _dumps(parish.aggregated_sacrament_stats),
+        _dumps(parish.aggregated_justice_campaigns),
+        parish.aggregated_volunteer_count,
+        parish.created_at or now,
+        now,
+    )
+
+
+def _sync_parish_events(conn: sqlite3.Connection, parishes: List['Parish']):
+    """Replace the parish_events rows of each parish"""
+    conn.executemany(_DELETE_PARISH_EVENTS_SQL, [(parish.id,) for parish in parishes])
+    conn.executemany(_INSERT_PARISH_EVENT_SQL, [
+        (parish.id, seq, event.get("name"), event.get("date"), event.get("ministry"))
+        for parish in parishes
+        for seq, event in enumerate(parish.events)
+    ])
+
+
+def _user_from_row(row: sqlite3.Row) -> 'User':
+    """User from a users row, columns addressed by name"""
+    from src.spiritual_os.models import User, UserRole
+    
+    return User(
+        id=row["id"],
+        name=row["name"],
+        email=row["email"],
+        role=UserRole(row["role"]),
+        parish_id=row["parish_id"],
+        diocese_id=row["diocese_id"],
+        opt_in_to_parish_aggregates=bool(row["opt_in_to_parish_aggregates"]),
+        opt_in_to_diocese_aggregates=bool(row["opt_in_to_diocese_aggregates"]),
+        opt_in_to_global_aggregates=bool(row["opt_in_to_global_aggregates"]),
+        privacy_level=row["privacy_level"],
+        rule_of_life=json.loads(row["rule_of_life"]) if row["rule_of_life"] else {},
+        journal_entries=json.loads(row["journal_entries"]) if row["journal_entries"] else [],
+        sacrament_milestones=json.loads(row["sacrament_milestones"]) if row["sacrament_milestones"] else [],
+        created_at=row["created_at"],
+        updated_at=row["updated_at"],
+    )
+
+
+def _parish_from_row(row: sqlite3.Row) -> 'Parish':
+    """Parish from a parishes row, columns addressed by name"""
+    from src.spiritual_os.models import Parish
+    
+    return Parish(
+        id=row["id"],
+        name=row["name"],
+        diocese_id=row["diocese_id"],
+        coordinator_id=row["coordinator_id"],
+        address=row["address"],
+        phone=row["phone"],
+        email=row["email"],
+        bulletin_text=row["bulletin_text"],
+        events=json.loads(row["events"]) if row["events"] else [],
+        volunteer_signups=json.loads(row["volunteer_signups"]) if row["volunteer_signups"] else [],
+        aggregated_members_count=row["aggregated_members_count"],
+        aggregated_formation_participants=row["aggregated_formation_participants"],
+        aggregated_avg_practice_minutes=row["aggregated_avg_practice_minutes"],
+        aggregated_sacrament_stats=json.loads(row["aggregated_sacrament_stats"]) if row["aggregated_sacrament_stats"] else {},
+        aggregated_justice_campaigns=json.loads(row["aggregated_justice_campaigns"]) if row["aggregated_justice_campaigns"] else [],
+        aggregated_volunteer_count=row["aggregated_volunteer_count"],
+        created_at=row["created_at"],
+        updated_at=row["updated_at"],
+    )
+
+
+class _ThreadConnection:
+    """
+    Holder for one thread's connection, stored in a threading.local
+    
+    When the thread ends (or the Database is dropped) the holder is
+    garbage collected and its finalizer closes the connection. weakref
+    finalizers also run once at interpreter exit, so no per-instance
+    atexit hook is needed.
+    """
+    __slots__ = ("conn", "__weakref__")
+    
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        weakref.finalize(self, conn.close)
+
 
 class Database:
     """SQLite database for Catholic Spiritual OS"""
@@ -18,11 +185,55 @@ class Database:
     def __init__(self, db_path: str = str(DB_PATH)):
         self.db_path = db_path
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        
+        # One long-lived connection per thread instead of connect/close per call
+        self._local = threading.local()
+        
         self.init_schema()
     
+    def _conn(self) -> sqlite3.Connection:
+        """This thread's connection, opened and tuned on first use"""
+        holder = getattr(self._local, "holder", None)
+        if holder is None:
+            # check_same_thread=False only so the finalizer may close it
+            # from whichever thread collects the holder
+            conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            for pragma in _PRAGMAS:
+                conn.execute(pragma)
+            holder = self._local.holder = _ThreadConnection(conn)
+        return holder.conn
+    
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Group several writes into one BEGIN IMMEDIATE ... COMMIT
+        
+        Connections autocommit, so each save_* is otherwise its own
+        transaction (and its own WAL sync). Inside this block a failure
+        rolls back every write made so far, and nothing is durable until
+        the block exits. Nested blocks join the outer transaction, and
+        save_* methods re-raise instead of returning False/0 so the
+        failure reaches this block.
+        """
+        conn = self._conn()
+        if conn.in_transaction:
+            yield conn
+            return
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+            conn.execute("COMMIT")
+        except BaseException:
+            # Also covers a failed COMMIT, which would otherwise leave the
+            # connection inside a transaction every later call joins
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+    
     def init_schema(self):
         """Initialize database schema"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn()
         cursor = conn.cursor()
         
         # Users table
@@ -144,76 +355,104 @@ class Database:
             )
         """)
         
-        conn.commit()
-        conn.close()
+        # Lookup indexes for the per-parish / per-diocese fan-out queries
+        # and the crisis auto-delete sweep
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_users_parish ON users(parish_id)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_users_diocese ON users(diocese_id)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_parishes_diocese ON parishes(diocese_id)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_crisis_autodelete ON crisis_events(auto_delete_date)")
+        
+        # Normalized journal entries / parish events. The JSON columns stay
+        # the source of truth for full records; these hold the fields that
+        # aggregation filters and counts on. (owner, seq) keys double as
+        # the parent lookup index.
+        needs_backfill = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'user_journal_entries'"
+        ).fetchone() is None
+        
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS user_journal_entries (
+                user_id TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                date TEXT,
+                template_type TEXT,
+                PRIMARY KEY (user_id, seq)
+            ) WITHOUT ROWID
+        """)
+        
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS parish_events (
+                parish_id TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                name TEXT,
+                date TEXT,
+                ministry TEXT,
+                PRIMARY KEY (parish_id, seq)
+            ) WITHOUT ROWID
+        """)
+        
+        # Databases created before the child tables: fill them once from
+        # the existing JSON columns
+        if needs_backfill:
+            with self.transaction():
+                cursor.execute("""
+                    INSERT INTO user_journal_entries
+                    SELECT users.id, entry.key,
+                           json_extract(entry.value, '$.date'),
+                           json_extract(entry.value, '$.template_type')
+                    FROM users, json_each(users.journal_entries) AS entry
+                """)
+                cursor.execute("""
+                    INSERT INTO parish_events
+                    SELECT parishes.id, event.key,
+                           json_extract(event.value, '$.name'),
+                           json_extract(event.value, '$.date'),
+                           json_extract(event.value, '$.ministry')
+                    FROM parishes, json_each(parishes.events) AS event
+                """)
     
     def save_user(self, user: 'User') -> bool:
         """Save or update user"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
             now = datetime.now().isoformat()
             
-            cursor.execute("""
-                INSERT OR REPLACE INTO users VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                user.id,
-                user.name,
-                user.email,
-                user.role.value,
-                user.parish_id,
-                user.diocese_id,
-                user.opt_in_to_parish_aggregates,
-                user.opt_in_to_diocese_aggregates,
-                user.opt_in_to_global_aggregates,
-                user.privacy_level,
-                json.dumps(user.rule_of_life),
-                json.dumps(user.journal_entries),
-                json.dumps(user.sacrament_milestones),
-                user.created_at or now,
-                now,
-            ))
+            with self.transaction() as conn:
+                conn.execute(_SAVE_USER_SQL, _user_row(user, now))
+                _sync_journal_entries(conn, [user])
             
-            conn.commit()
-            conn.close()
             return True
         except Exception as e:
+            if self._conn().in_transaction:
+                raise
             print(f"Error saving user: {e}")
             return False
     
+    def save_users_bulk(self, users: Iterable['User']) -> int:
+        """Save or update many users in one transaction; returns rows written"""
+        try:
+            now = datetime.now().isoformat()
+            users = list(users)
+            
+            with self.transaction() as conn:
+                written = conn.executemany(_SAVE_USER_SQL, [_user_row(user, now) for user in users]).rowcount
+                _sync_journal_entries(conn, users)
+            
+            return written
+        except Exception as e:
+            if self._conn().in_transaction:
+                raise
+            print(f"Error saving users: {e}")
+            return 0
+    
     def get_user(self, user_id: str) -> Optional['User']:
         """Get user by ID"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute("SELECT * FROM users WHERE id = ?", (user_id,))
-            row = cursor.fetchone()
-            conn.close()
+            row = self._conn().execute(_GET_USER_SQL, (user_id,)).fetchone()
             
             if not row:
                 return None
             
-            from src.spiritual_os.models import User, UserRole
-            
-            return User(
-                id=row[0],
-                name=row[1],
-                email=row[2],
-                role=UserRole(row[3]),
-                parish_id=row[4],
-                diocese_id=row[5],
-                opt_in_to_parish_aggregates=bool(row[6]),
-                opt_in_to_diocese_aggregates=bool(row[7]),
-                opt_in_to_global_aggregates=bool(row[8]),
-                privacy_level=row[9],
-                rule_of_life=json.loads(row[10]) if row[10] else {},
-                journal_entries=json.loads(row[11]) if row[11] else [],
-                sacrament_milestones=json.loads(row[12]) if row[12] else [],
-                created_at=row[13],
-                updated_at=row[14],
-            )
+            return _user_from_row(row)
         except Exception as e:
             print(f"Error getting user: {e}")
             return None
@@ -221,34 +460,16 @@ class Database:
     def get_users_in_parish(self, parish_id: str) -> List['User']:
         """Get all users in a parish"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute("SELECT * FROM users WHERE parish_id = ?", (parish_id,))
-            rows = cursor.fetchall()
-            conn.close()
-            
-            from src.spiritual_os.models import User, UserRole
+            cursor = self._conn().execute(_GET_PARISH_USERS_SQL, (parish_id,))
             
+            # Decode in batches so raw rows and decoded blobs never both
+            # exist for the whole parish at once
             users = []
-            for row in rows:
-                users.append(User(
-                    id=row[0],
-                    name=row[1],
-                    email=row[2],
-                    role=UserRole(row[3]),
-                    parish_id=row[4],
-                    diocese_id=row[5],
-                    opt_in_to_parish_aggregates=bool(row[6]),
-                    opt_in_to_diocese_aggregates=bool(row[7]),
-                    opt_in_to_global_aggregates=bool(row[8]),
-                    privacy_level=row[9],
-                    rule_of_life=json.loads(row[10]) if row[10] else {},
-                    journal_entries=json.loads(row[11]) if row[11] else [],
-                    sacrament_milestones=json.loads(row[12]) if row[12] else [],
-                    created_at=row[13],
-                    updated_at=row[14],
-                ))
+            while True:
+                rows = cursor.fetchmany(_FETCH_BATCH)
+                if not rows:
+                    break
+                users.extend(_user_from_row(row) for row in rows)
             
             return users
         except Exception as e:
@@ -258,99 +479,88 @@ class Database:
     def save_parish(self, parish: 'Parish') -> bool:
         """Save or update parish"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
             now = datetime.now().isoformat()
             
-            cursor.execute("""
-                INSERT OR REPLACE INTO parishes VALUES (
-                    ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                    ?, ?, ?, ?, ?, ?, ?, ?
-                )
-            """, (
-                parish.id,
-                parish.name,
-                parish.diocese_id,
-                parish.coordinator_id,
-                parish.address,
-                parish.phone,
-                parish.email,
-                parish.bulletin_text,
-                json.dumps(parish.events),
-                json.dumps(parish.volunteer_signups),
-                parish.aggregated_members_count,
-                parish.aggregated_formation_participants,
-                parish.aggregated_avg_practice_minutes,
-                json.dumps(parish.aggregated_sacrament_stats),
-                json.dumps(parish.aggregated_justice_campaigns),
-                parish.aggregated_volunteer_count,
-                parish.created_at or now,
-                now,
-            ))
+            with self.transaction() as conn:
+                conn.execute(_SAVE_PARISH_SQL, _parish_row(parish, now))
+                _sync_parish_events(conn, [parish])
             
-            conn.commit()
-            conn.close()
             return True
         except Exception as e:
+            if self._conn().in_transaction:
+                raise
             print(f"Error saving parish: {e}")
             return False
     
+    def save_parishes_bulk(self, parishes: Iterable['Parish']) -> int:
+        """Save or update many parishes in one transaction; returns rows written"""
+        try:
+            now = datetime.now().isoformat()
+            parishes = list(parishes)
+            
+            with self.transaction() as conn:
+                written = conn.executemany(_SAVE_PARISH_SQL, [_parish_row(parish, now) for parish in parishes]).rowcount
+                _sync_parish_events(conn, parishes)
+            
+            return written
+        except Exception as e:
+            if self._conn().in_transaction:
+                raise
+            print(f"Error saving parishes: {e}")
+            return 0
+    
     def get_parish(self, parish_id: str) -> Optional['Parish']:
         """Get parish by ID"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute("SELECT * FROM parishes WHERE id = ?", (parish_id,))
-            row = cursor.fetchone()
-            conn.close()
+            row = self._conn().execute(_GET_PARISH_SQL, (parish_id,)).fetchone()
             
             if not row:
                 return None
             
-            from src.spiritual_os.models import Parish
-            
-            return Parish(
-                id=row[0],
-                name=row[1],
-                diocese_id=row[2],
-                coordinator_id=row[3],
-                address=row[4],
-                phone=row[5],
-                email=row[6],
-                bulletin_text=row[7],
-                events=json.loads(row[8]) if row[8] else [],
-                volunteer_signups=json.loads(row[9]) if row[9] else [],
-                aggregated_members_count=row[10],
-                aggregated_formation_participants=row[11],
-                aggregated_avg_practice_minutes=row[12],
-                aggregated_sacrament_stats=json.loads(row[13]) if row[13] else {},
-                aggregated_justice_campaigns=json.loads(row[14]) if row[14] else [],
-                aggregated_volunteer_count=row[15],
-                created_at=row[16],
-                updated_at=row[17],
-            )
+            return _parish_from_row(row)
         except Exception as e:
             print(f"Error getting parish: {e}")
             return None
     
+    def count_journal_entries_by_template(self, parish_id: str) -> Dict[str, int]:
+        """Journal entries per template type across a parish's users"""
+        try:
+            rows = self._conn().execute("""
+                SELECT entry.template_type, COUNT(*)
+                FROM users JOIN user_journal_entries AS entry ON entry.user_id = users.id
+                WHERE users.parish_id = ?
+                GROUP BY entry.template_type
+            """, (parish_id,)).fetchall()
+            return dict(rows)
+        except Exception as e:
+            print(f"Error counting journal entries: {e}")
+            return {}
+    
+    def count_parish_events(self, parish_id: str, since: Optional[str] = None) -> int:
+        """Events of a parish, optionally only those on or after an ISO date"""
+        try:
+            row = self._conn().execute(
+                "SELECT COUNT(*) FROM parish_events WHERE parish_id = ? AND (? IS NULL OR date >= ?)",
+                (parish_id, since, since)
+            ).fetchone()
+            return row[0]
+        except Exception as e:
+            print(f"Error counting parish events: {e}")
+            return 0
+    
     def cleanup_expired_crises(self) -> int:
         """Delete crisis events past their auto_delete_date"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._conn()
             cursor = conn.cursor()
             
             now = datetime.now().isoformat()
-            cursor.execute(
-                "DELETE FROM crisis_events WHERE auto_delete_date < ?",
-                (now,)
-            )
+            cursor.execute(_DELETE_EXPIRED_CRISES_SQL, (now,))
             
             deleted = cursor.rowcount
-            conn.commit()
-            conn.close()
             return deleted
         except Exception as e:
+            if self._conn().in_transaction:
+                raise
             print(f"Error cleaning up crises: {e}")
             return 0
@@ -46,7 +46,7 @@ class CourseCategory(Enum):
     SPIRITUAL_FORMATION = "spiritual_formation"
 
 
-@dataclass
+@dataclass(slots=True)
 class CatechistCourse:
     """Individual course or formation event"""
     id: str
@@ -60,7 +60,7 @@ class CatechistCourse:
     notes: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class ObservationRecord:
     """Classroom observation by Master Catechist or DRE"""
     id: str
@@ -75,7 +75,7 @@ class ObservationRecord:
     hours_credited: float
 
 
-@dataclass
+@dataclass(slots=True)
 class CatechistCertification:
     """
     Complete certification record for a catechist
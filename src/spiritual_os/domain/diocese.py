@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class DioceseStats:
     """Aggregate statistics (NO personal data)"""
     total_parishes: int = 0
@@ -16,7 +16,7 @@ class DioceseStats:
     deacons_count: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Diocese:
     """Diocese entity for coordination"""
     name: str
@@ -64,8 +64,9 @@ class DioceseDirectory:
     
     def find_diocese(self, name: str) -> Optional[Diocese]:
         """Lookup diocese by name"""
+        name_lower = name.lower()
         for d in self.dioceses:
-            if d.name.lower() == name.lower():
+            if d.name.lower() == name_lower:
                 return d
         return None
     
@@ -3,11 +3,12 @@ Journaling Module - Spiritual reflection templates and journal entries
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional
+from types import MappingProxyType
+from typing import Any, List, Mapping, Optional
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class JournalEntry:
     """A spiritual journal entry"""
     date: str  # ISO format
@@ -30,72 +31,83 @@ class JournalEntry:
         }
 
 
+# Templates are constants: built once at import, read-only (tuple prompts)
+# because every caller shares the same object
+_EXAMEN_TEMPLATE = MappingProxyType({
+    "name": "Evening Examen",
+    "type": "examen_divina",
+    "prompts": (
+        "1. Presence: How was God present in my day?",
+        "2. Review: What moments brought consolation? Desolation?",
+        "3. Gratitude: What am I most grateful for today?",
+        "4. Sorrow: Where did I fall short of love?",
+        "5. Forward: What will I ask God's help for tomorrow?"
+    ),
+    "time_minutes": 10
+})
+
+_LECTIO_DIVINA_TEMPLATE = MappingProxyType({
+    "name": "Lectio Divina",
+    "type": "lectio_divina",
+    "prompts": (
+        "Lectio (Read): Read passage slowly. What word catches your attention?",
+        "Meditatio (Meditate): What is God saying to you through this word?",
+        "Oratio (Respond): How do you respond in prayer?",
+        "Contemplatio (Contemplate): Rest in God's presence and love."
+    ),
+    "time_minutes": 20
+})
+
+_HARDENING_HEALING_TEMPLATE = MappingProxyType({
+    "name": "Hardening vs. Healing",
+    "type": "hardening_healing",
+    "prompts": (
+        "Where is my heart hardened? (unforgiveness, bitterness, doubt)",
+        "How did this hardening begin?",
+        "What would healing look like?",
+        "What courage do I need from God?",
+        "One step toward healing this week?"
+    ),
+    "time_minutes": 15
+})
+
+_FATIGUE_WARNING_TEMPLATE = MappingProxyType({
+    "name": "Fatigue & Warning Signs",
+    "type": "fatigue_warning",
+    "prompts": (
+        "Do I feel distant from God? How?",
+        "Am I experiencing spiritual dryness?",
+        "Have I neglected prayer/Scripture/community?",
+        "Am I running on willpower instead of grace?",
+        "What 'pit' might I be sliding into?",
+        "What is one way to return to God today?"
+    ),
+    "time_minutes": 10
+})
+
+
 class JournalTemplate:
     """Guided reflection templates"""
     
     @staticmethod
-    def examen_template() -> dict:
+    def examen_template() -> Mapping[str, Any]:
         """Ignatian Examen - review of day with God"""
-        return {
-            "name": "Evening Examen",
-            "type": "examen_divina",
-            "prompts": [
-                "1. Presence: How was God present in my day?",
-                "2. Review: What moments brought consolation? Desolation?",
-                "3. Gratitude: What am I most grateful for today?",
-                "4. Sorrow: Where did I fall short of love?",
-                "5. Forward: What will I ask God's help for tomorrow?"
-            ],
-            "time_minutes": 10
-        }
+        return _EXAMEN_TEMPLATE
     
     @staticmethod
-    def lectio_divina_template() -> dict:
+    def lectio_divina_template() -> Mapping[str, Any]:
         """Lectio Divina - sacred reading"""
-        return {
-            "name": "Lectio Divina",
-            "type": "lectio_divina",
-            "prompts": [
-                "Lectio (Read): Read passage slowly. What word catches your attention?",
-                "Meditatio (Meditate): What is God saying to you through this word?",
-                "Oratio (Respond): How do you respond in prayer?",
-                "Contemplatio (Contemplate): Rest in God's presence and love."
-            ],
-            "time_minutes": 20
-        }
+        return _LECTIO_DIVINA_TEMPLATE
     
     @staticmethod
-    def hardening_healing_template() -> dict:
+    def hardening_healing_template() -> Mapping[str, Any]:
         """Exploring hardness of heart vs. healing"""
-        return {
-            "name": "Hardening vs. Healing",
-            "type": "hardening_healing",
-            "prompts": [
-                "Where is my heart hardened? (unforgiveness, bitterness, doubt)",
-                "How did this hardening begin?",
-                "What would healing look like?",
-                "What courage do I need from God?",
-                "One step toward healing this week?"
-            ],
-            "time_minutes": 15
-        }
+        return _HARDENING_HEALING_TEMPLATE
     
     @staticmethod
-    def fatigue_warning_template() -> dict:
+    def fatigue_warning_template() -> Mapping[str, Any]:
         """Warning signs of spiritual fatigue"""
-        return {
-            "name": "Fatigue & Warning Signs",
-            "type": "fatigue_warning",
-            "prompts": [
-                "Do I feel distant from God? How?",
-                "Am I experiencing spiritual dryness?",
-                "Have I neglected prayer/Scripture/community?",
-                "Am I running on willpower instead of grace?",
-                "What 'pit' might I be sliding into?",
-                "What is one way to return to God today?"
-            ],
-            "time_minutes": 10
-        }
+        return _FATIGUE_WARNING_TEMPLATE
 
 
 @dataclass
@@ -12,6 +12,7 @@ Key features:
 """
 
 from dataclasses import dataclass
+from functools import cached_property
 from typing import List, Optional, Dict, Any
 from datetime import datetime, time
 from enum import Enum
@@ -120,6 +121,31 @@ class SmallChristianCommunity:
     established_date: datetime
     is_active: bool
     notes: Optional[str]
+    
+    # Fixed display strings are cached on first access; meeting dates change, so those stay live
+    @cached_property
+    def meeting_time_str(self) -> str:
+        """Meeting time for display, e.g. 07:00 PM"""
+        return self.meeting_time.strftime('%I:%M %p')
+    
+    @property
+    def last_meeting_str(self) -> Optional[str]:
+        """Last meeting date for display, or None if not recorded"""
+        if self.last_meeting_date is None:
+            return None
+        return self.last_meeting_date.strftime('%b %d, %Y')
+    
+    @property
+    def upcoming_meeting_str(self) -> Optional[str]:
+        """Next meeting date for display, or None if not scheduled"""
+        if self.upcoming_meeting_date is None:
+            return None
+        return self.upcoming_meeting_date.strftime('%b %d, %Y')
+    
+    @cached_property
+    def established_str(self) -> str:
+        """Month and year the SCC was founded, e.g. June 2015"""
+        return self.established_date.strftime('%B %Y')
 
 
 @dataclass
@@ -139,6 +165,11 @@ class Zone:
     total_families: int
     geographic_area: str
     established_date: datetime
+    
+    @cached_property
+    def established_str(self) -> str:
+        """Month and year the zone was formed"""
+        return self.established_date.strftime('%B %Y')
 
 
 @dataclass
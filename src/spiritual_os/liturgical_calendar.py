@@ -13,7 +13,9 @@ Alternative: Liturgical Calendar API (https://litcal.johnromanodorazio.com/)
 """
 
 import requests
+import threading
 from datetime import date, datetime
+from types import MappingProxyType
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 from enum import Enum
@@ -38,6 +40,26 @@ class LiturgicalColor(Enum):
     BLACK = "black"
 
 
+# Display lookups (built once at import, read-only since they are shared)
+COLOR_EMOJI = MappingProxyType({
+    LiturgicalColor.GREEN: "🟢",
+    LiturgicalColor.WHITE: "⚪",
+    LiturgicalColor.RED: "🔴",
+    LiturgicalColor.PURPLE: "🟣",
+    LiturgicalColor.ROSE: "🌸",
+    LiturgicalColor.BLACK: "⚫"
+})
+
+COLOR_DESCRIPTIONS = MappingProxyType({
+    LiturgicalColor.GREEN: "Ordinary Time - Growth in faith",
+    LiturgicalColor.WHITE: "Joy and purity - Christmas, Easter, feasts of the Lord, Mary, saints who were not martyrs",
+    LiturgicalColor.RED: "Fire of the Holy Spirit, blood of martyrs - Pentecost, Holy Week, martyrs",
+    LiturgicalColor.PURPLE: "Penance and preparation - Advent, Lent",
+    LiturgicalColor.ROSE: "Rejoicing in anticipation - 3rd Sunday of Advent (Gaudete), 4th Sunday of Lent (Laetare)",
+    LiturgicalColor.BLACK: "Mourning - All Souls Day, funerals (optional)"
+})
+
+
 @dataclass
 class LiturgicalDay:
     """Liturgical data for a specific day"""
@@ -61,6 +83,18 @@ class LiturgicalCalendar:
     
     API_BASE = "http://calapi.inadiutorium.cz/api/v0/en"
     
+    # requests.Session is not thread-safe, so each Streamlit script thread
+    # keeps its own; repeat lookups on a thread still reuse the connection
+    _local = threading.local()
+    
+    @classmethod
+    def _session(cls) -> requests.Session:
+        """This thread's pooled HTTP session, created on first use"""
+        session = getattr(cls._local, "session", None)
+        if session is None:
+            session = cls._local.session = requests.Session()
+        return session
+    
     @classmethod
     def get_today(cls) -> Optional[LiturgicalDay]:
         """Get liturgical data for today"""
@@ -73,7 +107,7 @@ class LiturgicalCalendar:
             # Format: /en/calendars/default/2026/02/13
             url = f"{cls.API_BASE}/calendars/default/{target_date.year}/{target_date.month}/{target_date.day}"
             
-            response = requests.get(url, timeout=5)
+            response = cls._session().get(url, timeout=5)
             response.raise_for_status()
             
             data = response.json()
@@ -164,15 +198,7 @@ class LiturgicalCalendar:
     @classmethod
     def get_color_description(cls, color: LiturgicalColor) -> str:
         """Get human-readable description of liturgical color meaning"""
-        descriptions = {
-            LiturgicalColor.GREEN: "Ordinary Time - Growth in faith",
-            LiturgicalColor.WHITE: "Joy and purity - Christmas, Easter, feasts of the Lord, Mary, saints who were not martyrs",
-            LiturgicalColor.RED: "Fire of the Holy Spirit, blood of martyrs - Pentecost, Holy Week, martyrs",
-            LiturgicalColor.PURPLE: "Penance and preparation - Advent, Lent",
-            LiturgicalColor.ROSE: "Rejoicing in anticipation - 3rd Sunday of Advent (Gaudete), 4th Sunday of Lent (Laetare)",
-            LiturgicalColor.BLACK: "Mourning - All Souls Day, funerals (optional)"
-        }
-        return descriptions.get(color, "")
+        return COLOR_DESCRIPTIONS.get(color, "")
     
     @classmethod
     def format_for_display(cls, liturgical_day: LiturgicalDay) -> str:
@@ -180,16 +206,7 @@ class LiturgicalCalendar:
         if not liturgical_day:
             return "Liturgical data unavailable"
         
-        color_emoji = {
-            LiturgicalColor.GREEN: "🟢",
-            LiturgicalColor.WHITE: "⚪",
-            LiturgicalColor.RED: "🔴",
-            LiturgicalColor.PURPLE: "🟣",
-            LiturgicalColor.ROSE: "🌸",
-            LiturgicalColor.BLACK: "⚫"
-        }
-        
-        emoji = color_emoji.get(liturgical_day.color, "🔵")
+        emoji = COLOR_EMOJI.get(liturgical_day.color, "🔵")
         
         return f"""
 **{liturgical_day.primary_celebration}**
@@ -23,6 +23,7 @@ Context awareness:
 """
 
 import requests
+import threading
 from datetime import date, datetime
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
@@ -155,6 +156,18 @@ class MassReadingsAPI:
     # Fallback for demo/testing
     DEMO_API = "https://api.daily-mass-readings.org"
     
+    # Per-thread, since Session isn't thread-safe; sources and reruns on a
+    # thread share its keep-alive connections
+    _local = threading.local()
+    
+    @classmethod
+    def _session(cls) -> requests.Session:
+        """Session for the calling thread, opened on first lookup"""
+        session = getattr(cls._local, "session", None)
+        if session is None:
+            session = cls._local.session = requests.Session()
+        return session
+    
     @classmethod
     def get_today(cls, connection_speed: str = "fast") -> Optional[MassReadings]:
         """
@@ -271,7 +284,7 @@ class MassReadingsAPI:
                 # Fallback format
                 url = f"{cls.DEMO_API}/readings/{target_date.isoformat()}"
             
-            response = requests.get(url, timeout=source.timeout)
+            response = cls._session().get(url, timeout=source.timeout)
             response.raise_for_status()
             
             data = response.json()
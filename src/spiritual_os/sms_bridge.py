@@ -186,7 +186,9 @@ Reply HELP for all commands"""
         # In production: Query ChurchDirectory
         # For now: Demo response
         
-        if "nakuru" in location.lower():
+        location_lower = location.lower()
+        
+        if "nakuru" in location_lower:
             response = """Nakuru Cathedral:
 Sun: 7am, 9am, 11am, 5pm
 Mon-Fri: 6:30am, 12:15pm
@@ -197,7 +199,7 @@ Location: Kenyatta Ave
 
 Reply CHURCH NAKURU for more churches"""
         
-        elif "namugongo" in location.lower():
+        elif "namugongo" in location_lower:
             response = """Uganda Martyrs Shrine:
 Sun: 8am (Luganda), 10am (English)
 Daily: 7am, 5pm
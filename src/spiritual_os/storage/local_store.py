@@ -3,6 +3,7 @@ Storage Module - Privacy-first local file storage
 """
 
 import json
+import os
 from pathlib import Path
 from typing import Any, Optional
 from datetime import datetime
@@ -26,8 +27,19 @@ class LocalStore:
                 **data,
                 "_saved_at": datetime.now().isoformat()
             }
-            with open(filepath, "w") as f:
-                json.dump(data_with_ts, f, indent=2)
+            # Write a sibling temp file, fsync it, then swap it in: readers
+            # see either the old file or the complete new one, even after
+            # a crash or power loss mid-write
+            tmp_path = filepath.with_suffix(".tmp")
+            try:
+                with open(tmp_path, "w") as f:
+                    json.dump(data_with_ts, f, indent=2)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, filepath)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
             return True
         except Exception as e:
             print(f"Storage error: {e}")